@@ -1,6 +1,7 @@
 """Database configuration and session management."""
 
 from collections.abc import Generator
+from contextvars import ContextVar
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
@@ -20,6 +21,11 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
+# Session bound by the test suite; when set, get_db yields it instead of opening one
+_current_test_session: ContextVar[Session | None] = ContextVar(
+    "_current_test_session", default=None
+)
+
 
 def init_db() -> None:
     """Initialize database by creating all tables."""
@@ -36,6 +42,12 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Database session that will be automatically closed after use
     """
+    bound_session = _current_test_session.get()
+    if bound_session is not None:
+        # Owned by the test fixture, which handles rollback and close
+        yield bound_session
+        return
+
     db = SessionLocal()
     try:
         yield db
@@ -224,51 +224,9 @@ def query_graph(
         return graph
 
     # Apply server-side filtering
-    hosts = graph_json.get("hosts", [])
-    edges = graph_json.get("edges", [])
-    meta = graph_json.get("meta", {}).copy()
-
-    # Filter edges based on all provided filters
-    filtered_edges = []
-    for edge in edges:
-        # Check host filter (partial match on src_host or dst_host)
-        if host:
-            src_match = host.lower() in edge.get("src_host", "").lower()
-            dst_match = host.lower() in edge.get("dst_host", "").lower()
-            if not (src_match or dst_match):
-                continue
-
-        # Check index filter (exact match in indexes array)
-        if index:
-            if index not in edge.get("indexes", []):
-                continue
-
-        # Check protocol filter (exact match)
-        if protocol:
-            if edge.get("protocol") != protocol:
-                continue
-
-        # Edge matches all filters
-        filtered_edges.append(edge)
-
-    # Filter hosts to only include those referenced in filtered edges
-    referenced_host_ids = set()
-    for edge in filtered_edges:
-        referenced_host_ids.add(edge.get("src_host"))
-        referenced_host_ids.add(edge.get("dst_host"))
-
-    filtered_hosts = [h for h in hosts if h.get("id") in referenced_host_ids]
-
-    # Build filtered graph JSON with updated meta counts
-    filtered_meta = meta.copy()
-    filtered_meta["host_count"] = len(filtered_hosts)
-    filtered_meta["edge_count"] = len(filtered_edges)
-
-    filtered_graph_json = {
-        "hosts": filtered_hosts,
-        "edges": filtered_edges,
-        "meta": filtered_meta,
-    }
+    filtered_graph_json = export.apply_graph_filters(
+        graph_json, host=host, index=index, protocol=protocol
+    )
 
     # Build response payload matching GraphResponse using original graph fields
     response_payload = {
@@ -353,7 +311,7 @@ def export_graph_endpoint(
     - png: Rendered graph image (requires system Graphviz)
     - pdf: Rendered graph document (requires system Graphviz)
 
-    For DOT/JSON formats, returns string content directly.
+    For DOT/JSON formats, returns the content directly.
     For PNG/PDF formats, generates file and streams with FileResponse.
     Temporary files are cleaned up automatically via BackgroundTasks.
 
@@ -385,18 +343,15 @@ def export_graph_endpoint(
         )
 
     try:
-        # Validate format
-        export.validate_export_format(format)
-
         # Extract canonical graph from json_blob
         graph_json = graph.json_blob
 
-        # Call export service
+        # Call export service (validates the format, raising ValueError if unsupported)
         content_or_path, media_type = export.export_graph(graph_json, format, graph_id)
 
         # Handle response based on format
-        if isinstance(content_or_path, str):
-            # DOT or JSON: return string content directly
+        if isinstance(content_or_path, str | bytes):
+            # DOT (str) or JSON (bytes): return content directly
             return Response(
                 content=content_or_path,
                 media_type=media_type,
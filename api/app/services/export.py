@@ -6,10 +6,10 @@ This module provides functionality for generating graph exports in multiple form
 - JSON: Canonical graph structure as JSON
 - PNG: Rendered graph image (requires system Graphviz)
 - PDF: Rendered graph document (requires system Graphviz)
+- ZIP: Archive bundling several of the above, sharing one DOT build
 
 Dependencies:
-    - Python graphviz package (wrapper around system Graphviz)
-    - System Graphviz must be installed:
+    - System Graphviz (the dot executable, invoked via subprocess) must be installed:
         - Debian/Ubuntu: apt-get install graphviz
         - Alpine: apk add graphviz
         - macOS: brew install graphviz
@@ -17,7 +17,10 @@ Dependencies:
 File Handling:
     - DOT and JSON exports return strings directly
     - PNG and PDF exports create temporary files that must be cleaned up by caller
+    - Export archives are written as .zip files that must be cleaned up by caller
     - Files are written to STORAGE_ROOT/exports/{graph_id}/
+    - Rendered PNG/PDF files are also kept in STORAGE_ROOT/exports/.render_cache/,
+      keyed by a hash of the DOT source, so repeat exports skip Graphviz
 
 Integration:
     - Called by graphs router for export endpoints
@@ -25,22 +28,53 @@ Integration:
     - Converts canonical graph JSON to various formats per spec section 4.2
 """
 
-import json
+import hashlib
 import logging
+import os
+import shutil
+import subprocess
+import uuid
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-import graphviz  # type: ignore
-from graphviz.backend import CalledProcessError, ExecutableNotFound  # type: ignore
+import orjson
 
+from app.services.resolver import GENERATOR
 from app.services.storage import get_exports_directory
 
 # Supported export formats
-EXPORT_FORMATS = {"dot", "json", "png", "pdf"}
+EXPORT_FORMATS = frozenset({"dot", "json", "png", "pdf"})
+
+# Export formats rendered by Graphviz
+IMAGE_FORMATS = frozenset({"png", "pdf"})
+
+# Formats bundled by create_export_archive, in archive entry order
+ARCHIVE_FORMATS = ("dot", "json", "png", "pdf")
+
+# Zip compression per archive entry format: text compresses well, while Graphviz
+# PNG/PDF output is already deflate-compressed and is stored as-is
+ARCHIVE_COMPRESSION = {
+    "dot": zipfile.ZIP_DEFLATED,
+    "json": zipfile.ZIP_DEFLATED,
+    "png": zipfile.ZIP_STORED,
+    "pdf": zipfile.ZIP_STORED,
+}
 
 # Graphviz layout engine for hierarchical graphs
 LAYOUT_ENGINE = "dot"
 
+GRAPHVIZ_NOT_INSTALLED = (
+    "Graphviz is not installed. Please install system Graphviz: "
+    "apt-get install graphviz (Debian/Ubuntu) or "
+    "apk add graphviz (Alpine) or "
+    "brew install graphviz (macOS)"
+)
+
 # Graph attributes for better rendering
 GRAPH_ATTRS = {
     "rankdir": "LR",  # Left to right layout
@@ -58,6 +92,15 @@ NODE_COLORS = {
     "unknown": "#E0E0E0",  # Gray
 }
 
+# Role abbreviations for node labels (other roles use their first 3 letters, uppercased)
+ROLE_ABBREVIATIONS = {
+    "universal_forwarder": "UF",
+    "heavy_forwarder": "HF",
+    "indexer": "IDX",
+    "search_head": "SH",
+    "unknown": "?",
+}
+
 # Edge colors by protocol
 EDGE_COLORS = {
     "splunktcp": "#1976D2",  # Blue
@@ -70,6 +113,49 @@ EDGE_COLORS = {
 # Maximum number of indexes to display in edge labels
 MAX_DISPLAYED_INDEXES = 3
 
+# Node fill/outline attributes keyed by (primary role, is_placeholder), so the node
+# loop does one lookup instead of branching on role and placeholder status
+_NODE_STYLE_ATTRS = {
+    (role, is_placeholder): (
+        f'fillcolor="{color}", style="{"filled,dashed" if is_placeholder else "filled"}"'
+    )
+    for role, color in NODE_COLORS.items()
+    for is_placeholder in (False, True)
+}
+
+# Translation table escaping host IDs for use inside double-quoted DOT strings
+_DOT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Extra node label line, indexed by is_placeholder
+_PLACEHOLDER_LABEL_SUFFIX = ("", "\\n(placeholder)")
+
+# Directory (under the exports directory) holding content-addressed rendered images
+RENDER_CACHE_DIR = ".render_cache"
+
+# Maximum number of rendered images kept in the render cache (oldest evicted first)
+RENDER_CACHE_SIZE = 64
+
+# Suffix of the temporary names _link_file renames into place
+_LINK_TMP_SUFFIX = ".tmp"
+
+# Canonical empty graph and its JSON export, indexed by pretty
+_EMPTY_GRAPH: dict[str, Any] = {"hosts": [], "edges": [], "meta": {}}
+_EMPTY_GRAPH_JSON = {
+    True: orjson.dumps(_EMPTY_GRAPH, option=orjson.OPT_INDENT_2),
+    False: orjson.dumps(_EMPTY_GRAPH),
+}
+
+# Minimal valid DOT for a graph without hosts or edges
+_EMPTY_DOT_LINES = ("digraph G {\n", '    label="Empty Graph";\n', "}\n")
+_EMPTY_DOT = "".join(_EMPTY_DOT_LINES)
+
+# DOT line templates, formatted once per node/edge in the builder's hot loops
+_NODE_TEMPLATE = '    "{id}" [label="{label}", shape=box, {style}];\n'
+_EDGE_TEMPLATE = '    "{src}" -> "{dst}" [label="{label}", color="{color}", penwidth={penwidth}];\n'
+_EDGE_TLS_TEMPLATE = (
+    '    "{src}" -> "{dst}" [label="{label}", color="{color}", style=bold, penwidth={penwidth}];\n'
+)
+
 # Penwidth calculation constants
 BASE_PENWIDTH = 1.0
 WEIGHT_MULTIPLIER = 0.5
@@ -78,10 +164,14 @@ MAX_PENWIDTH = 5.0
 logger = logging.getLogger(__name__)
 
 
+@cache
 def validate_export_format(export_format: str) -> str:
     """
     Validate that the export format is supported.
 
+    Memoized: only valid formats are cached (a failing call raises and stores
+    nothing), so the cache stays bounded by the case variants of EXPORT_FORMATS.
+
     Args:
         export_format: The export format string (case-insensitive)
 
@@ -100,12 +190,97 @@ def validate_export_format(export_format: str) -> str:
     return format_lower
 
 
-def build_dot_from_canonical_graph(graph_json: dict[str, Any]) -> str:
+def apply_graph_filters(
+    graph_json: dict[str, Any],
+    *,
+    host: str | None = None,
+    index: str | None = None,
+    protocol: str | None = None,
+    roles: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Filter a canonical graph down to matching hosts and edges.
+
+    Edge filters (all optional, combined with AND):
+    - host: Partial, case-insensitive match on src_host or dst_host
+    - index: Exact match in the edge's indexes array
+    - protocol: Exact match on the edge's protocol
+
+    roles restricts the graph to hosts having any of the given roles; edges are
+    kept only if both endpoints survive. With any edge filter set, the result
+    holds only hosts referenced by matching edges. Otherwise every host that
+    passes the role filter is kept, even if it has no edges.
+
+    Hosts and edges are each scanned once, using set membership for host and role
+    lookups. The input graph is not modified; meta is copied with updated
+    host_count and edge_count.
+
+    Args:
+        graph_json: Canonical graph structure
+        host: Optional host ID filter (partial match)
+        index: Optional index filter
+        protocol: Optional protocol filter
+        roles: Optional roles to keep
+
+    Returns:
+        Filtered canonical graph structure
+    """
+    hosts = graph_json.get("hosts", [])
+    edges = graph_json.get("edges", [])
+
+    role_set = frozenset(roles) if roles else None
+    if role_set is None:
+        allowed_ids = None
+    else:
+        allowed_ids = frozenset(
+            h.get("id") for h in hosts if not role_set.isdisjoint(h.get("roles", ()))
+        )
+
+    host_lower = host.lower() if host else None
+    filtered_edges = []
+    referenced_host_ids = set()
+    for edge in edges:
+        src = edge.get("src_host", "")
+        dst = edge.get("dst_host", "")
+        if allowed_ids is not None and (src not in allowed_ids or dst not in allowed_ids):
+            continue
+        if host_lower and host_lower not in src.lower() and host_lower not in dst.lower():
+            continue
+        if index and index not in edge.get("indexes", ()):
+            continue
+        if protocol and edge.get("protocol") != protocol:
+            continue
+        filtered_edges.append(edge)
+        referenced_host_ids.add(src)
+        referenced_host_ids.add(dst)
+
+    if host or index or protocol:
+        filtered_hosts = [h for h in hosts if h.get("id") in referenced_host_ids]
+    elif allowed_ids is not None:
+        filtered_hosts = [h for h in hosts if h.get("id") in allowed_ids]
+    else:
+        filtered_hosts = list(hosts)
+
+    filtered_meta = dict(graph_json.get("meta", {}))
+    filtered_meta["host_count"] = len(filtered_hosts)
+    filtered_meta["edge_count"] = len(filtered_edges)
+
+    return {
+        "hosts": filtered_hosts,
+        "edges": filtered_edges,
+        "meta": filtered_meta,
+    }
+
+
+def build_dot_from_canonical_graph(
+    graph_json: dict[str, Any], render_isolated: bool = True
+) -> str:
     """
     Convert canonical graph JSON to Graphviz DOT format.
 
     The canonical graph structure (per spec 4.2) contains:
-    - hosts: Array of host objects with id, roles, is_placeholder
+    - hosts: Array of host objects with id, roles, labels (placeholder hosts are
+      labelled "placeholder" or flagged is_placeholder)
     - edges: Array of edge objects with src_host, dst_host, protocol, indexes, etc.
     - meta: Metadata about the graph
 
@@ -125,6 +300,8 @@ def build_dot_from_canonical_graph(graph_json: dict[str, Any]) -> str:
 
     Args:
         graph_json: Canonical graph structure with hosts and edges arrays
+        render_isolated: Whether to emit hosts no edge references; False gives a
+            compact graph of connected hosts only, for smaller and faster layouts
 
     Returns:
         DOT format string representing the graph
@@ -132,95 +309,127 @@ def build_dot_from_canonical_graph(graph_json: dict[str, Any]) -> str:
     Raises:
         ValueError: If graph is empty or invalid
     """
+    if not graph_json.get("hosts") and not graph_json.get("edges"):
+        logger.warning("Empty graph provided for DOT export")
+        return _EMPTY_DOT
+    return "".join(iter_dot_lines(graph_json, render_isolated))
+
+
+@lru_cache(maxsize=256)
+def _format_role_labels(roles: tuple[str, ...]) -> str:
+    """Abbreviated role list for a node label, e.g. ("heavy_forwarder", "indexer") -> "HF, IDX".
+
+    Graphs have thousands of hosts but only a handful of distinct role combinations,
+    so each combination is formatted once.
+    """
+    return ", ".join(ROLE_ABBREVIATIONS.get(r, r.upper()[:3]) for r in roles)
+
+
+def _weight_to_penwidth(weight: int) -> float:
+    """Edge thickness for an edge weight: thicker for higher weight, capped at MAX_PENWIDTH."""
+    return min(BASE_PENWIDTH + (weight - 1) * WEIGHT_MULTIPLIER, MAX_PENWIDTH)
+
+
+def iter_dot_lines(graph_json: dict[str, Any], render_isolated: bool = True) -> Iterator[str]:
+    """
+    Yield the DOT source for a canonical graph one newline-terminated line at a time.
+
+    Lets consumers stream large graphs without holding the whole DOT string;
+    "".join() of the lines equals build_dot_from_canonical_graph.
+
+    Args:
+        graph_json: Canonical graph structure with hosts and edges arrays
+        render_isolated: Whether to emit hosts no edge references
+
+    Yields:
+        DOT lines, each ending in a newline
+    """
     hosts = graph_json.get("hosts", [])
     edges = graph_json.get("edges", [])
 
     if not hosts and not edges:
         logger.warning("Empty graph provided for DOT export")
-        # Return minimal valid DOT graph
-        return "digraph G {\n    label=\"Empty Graph\";\n}\n"
-
-    dot_lines = ["digraph G {"]
+        yield from _EMPTY_DOT_LINES
+        return
+
+    if not render_isolated:
+        # Compact mode: skip hosts that no edge references
+        referenced = {edge.get("src_host", "unknown") for edge in edges}
+        referenced.update(edge.get("dst_host", "unknown") for edge in edges)
+        hosts = [host for host in hosts if host.get("id", "unknown") in referenced]
+
+    yield "digraph G {\n"
+    # Bind hot methods once instead of resolving them per node/edge
+    format_node = _NODE_TEMPLATE.format
+    format_edge = _EDGE_TEMPLATE.format
+    format_tls_edge = _EDGE_TLS_TEMPLATE.format
+    node_styles_get = _NODE_STYLE_ATTRS.get
+    format_role_labels = _format_role_labels
+    edge_colors_get = EDGE_COLORS.get
+    weight_to_penwidth = _weight_to_penwidth
+    # Host ID -> DOT-escaped ID, filled by the node loop and reused for edge endpoints
+    escaped_ids: dict[str, str] = {}
+    escaped_ids_get = escaped_ids.get
 
     # Add graph attributes
     for attr_key, attr_val in GRAPH_ATTRS.items():
-        dot_lines.append(f'    {attr_key}="{attr_val}";')
+        yield f'    {attr_key}="{attr_val}";\n'
 
     # Add node declarations
     for host in hosts:
         host_id = host.get("id", "unknown")
+        escaped_ids[host_id] = escaped_id = host_id.translate(_DOT_ESCAPE)
         roles = host.get("roles", [])
-        is_placeholder = host.get("is_placeholder", False)
+        # The resolver labels placeholder hosts "placeholder"; an explicit
+        # is_placeholder flag is honoured too (no pattern matching on host IDs)
+        labels = host.get("labels", ())
+        is_placeholder = bool(host.get("is_placeholder")) or "placeholder" in labels
 
-        # Determine node color based on primary role
+        # Node color and outline come from the primary role and placeholder status
         primary_role = roles[0] if roles else "unknown"
-        color = NODE_COLORS.get(primary_role, NODE_COLORS["unknown"])
-
-        # Build label with host ID and roles
-        role_abbrev = {
-            "universal_forwarder": "UF",
-            "heavy_forwarder": "HF",
-            "indexer": "IDX",
-            "search_head": "SH",
-            "unknown": "?",
-        }
-        role_labels = ", ".join(role_abbrev.get(r, r.upper()[:3]) for r in roles)
-        label = f"{host_id}\\n{role_labels}"
+        style = node_styles_get((primary_role, is_placeholder))
+        if style is None:
+            style = _NODE_STYLE_ATTRS["unknown", is_placeholder]
 
-        # Add placeholder indicator
-        if is_placeholder:
-            label += "\\n(placeholder)"
+        # Build label with host ID and roles (placeholder nodes get an extra line)
+        role_labels = format_role_labels(tuple(roles))
+        label = f"{escaped_id}\\n{role_labels}{_PLACEHOLDER_LABEL_SUFFIX[is_placeholder]}"
 
-        # Node attributes with conditional style based on placeholder status
-        style_value = "filled,dashed" if is_placeholder else "filled"
-        node_attrs = [
-            f'label="{label}"',
-            "shape=box",
-            f'fillcolor="{color}"',
-            f'style="{style_value}"',
-        ]
-
-        dot_lines.append(f'    "{host_id}" [{", ".join(node_attrs)}];')
+        yield format_node(id=escaped_id, label=label, style=style)
 
     # Add edge declarations
     for edge in edges:
         src = edge.get("src_host", "unknown")
         dst = edge.get("dst_host", "unknown")
+        # Endpoints are normally declared hosts; escape any that are not
+        src = escaped_ids_get(src) or src.translate(_DOT_ESCAPE)
+        dst = escaped_ids_get(dst) or dst.translate(_DOT_ESCAPE)
         protocol = edge.get("protocol", "unknown")
         indexes = edge.get("indexes", [])
         tls_enabled = edge.get("tls", False)
         weight = edge.get("weight", 1)
-        # Build label with protocol and indexes
-        label_parts = [protocol]
-        if indexes:
-            # Limit to MAX_DISPLAYED_INDEXES for readability
-            label_parts.append(", ".join(indexes[:MAX_DISPLAYED_INDEXES]))
-            if len(indexes) > MAX_DISPLAYED_INDEXES:
-                label_parts.append(f"(+{len(indexes) - MAX_DISPLAYED_INDEXES} more)")
-        label = "\\n".join(label_parts)
+        # Build label with protocol and indexes, limited to MAX_DISPLAYED_INDEXES for
+        # readability; only the shown slice is joined, however many indexes there are
+        if not indexes:
+            label = protocol
+        else:
+            shown = ", ".join(indexes[:MAX_DISPLAYED_INDEXES])
+            hidden = len(indexes) - MAX_DISPLAYED_INDEXES
+            if hidden > 0:
+                label = f"{protocol}\\n{shown}\\n(+{hidden} more)"
+            else:
+                label = f"{protocol}\\n{shown}"
 
         # Determine edge color based on protocol
-        edge_color = EDGE_COLORS.get(protocol, "#999999")
-
-        # Edge attributes
-        edge_attrs = [
-            f'label="{label}"',
-            f'color="{edge_color}"',
-        ]
-
-        if tls_enabled:
-            edge_attrs.append("style=bold")
+        edge_color = edge_colors_get(protocol, "#999999")
 
-        # Set penwidth based on weight (thicker for higher weight)
-        # Cap at MAX_PENWIDTH
-        penwidth = min(BASE_PENWIDTH + (weight - 1) * WEIGHT_MULTIPLIER, MAX_PENWIDTH)
-        edge_attrs.append(f"penwidth={penwidth}")
-
-        dot_lines.append(f'    "{src}" -> "{dst}" [{", ".join(edge_attrs)}];')
-
-    dot_lines.append("}")
+        # TLS-enabled edges are drawn bold
+        format_line = format_tls_edge if tls_enabled else format_edge
+        yield format_line(
+            src=src, dst=dst, label=label, color=edge_color, penwidth=weight_to_penwidth(weight)
+        )
 
-    return "\n".join(dot_lines) + "\n"
+    yield "}\n"
 
 
 def export_as_dot(graph_json: dict[str, Any]) -> str:
@@ -236,31 +445,396 @@ def export_as_dot(graph_json: dict[str, Any]) -> str:
     return build_dot_from_canonical_graph(graph_json)
 
 
-def export_as_json(graph_json: dict[str, Any]) -> str:
+def _is_canonical_empty_graph(graph_json: dict[str, Any]) -> bool:
+    """Whether graph_json equals _EMPTY_GRAPH with the same key order.
+
+    Key order matters because it is preserved in the JSON output. Comparing item
+    lists stops at the first key or value that differs, so a non-empty graph fails
+    on its first non-empty array without walking it.
+    """
+    return len(graph_json) == len(_EMPTY_GRAPH) and list(graph_json.items()) == list(
+        _EMPTY_GRAPH.items()
+    )
+
+
+def export_as_json_bytes(graph_json: dict[str, Any], pretty: bool = True) -> bytes:
+    """
+    Generate JSON format export as UTF-8 bytes.
+
+    Serializes the canonical graph structure with orjson, which is several times
+    faster than the stdlib encoder on large graphs (notably on the indented path).
+    This returns the graph as-is without transformation; key order is preserved.
+    Byte sinks such as archive entries use this directly to skip a decode/encode
+    round trip.
+
+    Args:
+        graph_json: Canonical graph structure
+        pretty: Indent with 2 spaces (default); False emits compact JSON
+
+    Returns:
+        UTF-8 encoded JSON (pretty-printed unless pretty=False)
+    """
+    # Trivial empty graph: return the pre-serialized form
+    if _is_canonical_empty_graph(graph_json):
+        return _EMPTY_GRAPH_JSON[bool(pretty)]
+
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    return orjson.dumps(graph_json, option=option)
+
+
+def export_as_json(graph_json: dict[str, Any], pretty: bool = True) -> str:
     """
     Generate JSON format export.
 
-    Simply serializes the canonical graph structure to pretty-printed JSON.
-    This returns the graph as-is without transformation.
+    String wrapper around export_as_json_bytes for text responses.
+
+    Args:
+        graph_json: Canonical graph structure
+        pretty: Indent with 2 spaces (default); False emits compact JSON
+
+    Returns:
+        JSON string (pretty-printed unless pretty=False)
+    """
+    return export_as_json_bytes(graph_json, pretty=pretty).decode()
+
+
+def write_json_stream(graph_json: dict[str, Any], fp: IO[bytes]) -> None:
+    """
+    Write the pretty-printed JSON export to a binary file object incrementally.
+
+    Top-level arrays (hosts, edges) are serialized one element at a time, so peak
+    memory holds a single host or edge rather than the whole serialized graph.
+    Output is byte-identical to export_as_json_bytes(graph_json).
 
     Args:
         graph_json: Canonical graph structure
+        fp: Writable binary file object (e.g. an open zip entry)
+    """
+    dumps = orjson.dumps
+    indent = orjson.OPT_INDENT_2
+    write = fp.write
+
+    if not graph_json:
+        write(b"{}")
+        return
+
+    # Nested values are re-indented to their depth; JSON strings never contain a
+    # raw newline, so every b"\n" in orjson output is a line break
+    write(b"{")
+    for i, (key, value) in enumerate(graph_json.items()):
+        write(b",\n  " if i else b"\n  ")
+        write(dumps(key))
+        write(b": ")
+        if isinstance(value, list) and value:
+            write(b"[")
+            for j, item in enumerate(value):
+                write(b",\n    " if j else b"\n    ")
+                write(dumps(item, option=indent).replace(b"\n", b"\n    "))
+            write(b"\n  ]")
+        else:
+            write(dumps(value, option=indent).replace(b"\n", b"\n  "))
+    write(b"\n}")
+
+
+@cache
+def _dot_output_formats() -> frozenset[str] | None:
+    """
+    Probe the output formats supported by the installed dot build, once per process.
+
+    Minimal Graphviz builds (e.g. without cairo) lack formats such as PDF. Checking
+    up front gives a clear error instead of a failed or degraded render. Running
+    "dot -T?" lists the supported formats on stderr.
 
     Returns:
-        Pretty-printed JSON string
+        Supported format names, or None if the list could not be determined
+
+    Raises:
+        RuntimeError: If Graphviz is not installed (not cached; retried next call)
     """
-    return json.dumps(graph_json, indent=2, sort_keys=False)
+    try:
+        result = subprocess.run([LAYOUT_ENGINE, "-T?"], capture_output=True)
+    except FileNotFoundError as e:
+        logger.error(f"Graphviz not found: {e}")
+        raise RuntimeError(GRAPHVIZ_NOT_INSTALLED) from e
+
+    _, found, supported = result.stderr.decode(errors="replace").partition("Use one of:")
+    if not found:
+        logger.warning("Could not determine Graphviz output formats; skipping check")
+        return None
+    return frozenset(supported.split())
 
 
-def export_as_image(graph_json: dict[str, Any], export_format: str, graph_id: int) -> Path:
+def _require_dot_formats(formats: Iterable[str]) -> None:
+    """
+    Raise if the installed dot build cannot render any of the given formats.
+
+    Raises:
+        RuntimeError: If Graphviz is not installed or lacks a requested format
+    """
+    supported = _dot_output_formats()
+    if supported is None:
+        return
+    missing = [export_format for export_format in formats if export_format not in supported]
+    if missing:
+        raise RuntimeError(
+            f"Graphviz does not support {', '.join(f.upper() for f in missing)} output. "
+            "Install a Graphviz build with cairo support (e.g. the full graphviz package)."
+        )
+
+
+def _run_dot(args: list[str], dot_bytes: bytes) -> bytes:
+    """
+    Run Graphviz with the DOT source piped over stdin.
+
+    Piping avoids writing (and later removing) an intermediate .gv file for every
+    render. All Graphviz invocations go through here so failures are reported
+    consistently.
+
+    Args:
+        args: dot arguments (output format and destination flags)
+        dot_bytes: Encoded DOT source
+
+    Returns:
+        dot's stdout (the rendered output when no -o flag is given)
+
+    Raises:
+        RuntimeError: If Graphviz is not installed or rendering fails
+    """
+    try:
+        result = subprocess.run(
+            [LAYOUT_ENGINE, *args],
+            input=dot_bytes,
+            check=True,
+            capture_output=True,
+        )
+    except FileNotFoundError as e:
+        logger.error(f"Graphviz not found: {e}")
+        raise RuntimeError(GRAPHVIZ_NOT_INSTALLED) from e
+    except subprocess.CalledProcessError as e:
+        stderr = (e.stderr or b"").decode(errors="replace").strip()
+        logger.error(f"Graphviz rendering failed: {e}: {stderr}")
+        logger.debug(f"DOT content:\n{dot_bytes.decode(errors='replace')}")
+        raise RuntimeError(f"Graphviz rendering failed: {stderr or e}") from e
+
+    return result.stdout
+
+
+def _pipe_dot(dot_bytes: bytes, export_format: str) -> bytes:
+    """
+    Render DOT source to a single format and return the rendered bytes from stdout.
+
+    Nothing touches the filesystem, so callers can stream the output straight
+    into its destination (e.g. a zip entry) without a temp-file round trip.
+
+    Args:
+        dot_bytes: Encoded DOT source
+        export_format: Graphviz output format (e.g. "png")
+
+    Returns:
+        Rendered output
+
+    Raises:
+        RuntimeError: If Graphviz is not installed, lacks the format, or rendering fails
+    """
+    _require_dot_formats([export_format])
+    return _run_dot([f"-T{export_format}"], dot_bytes)
+
+
+def _render_dot_files(
+    dot_string: str, formats: list[str], graph_id: int, dpi: int | None = None
+) -> dict[str, Path]:
+    """
+    Render an already-built DOT string to image files with one Graphviz invocation.
+
+    dot accepts repeated "-T<format> -o <path>" pairs, so every requested format is
+    rendered to STORAGE_ROOT/exports/{graph_id}/graph_{graph_id}.<format> by a
+    single process reading the DOT source from stdin. dot writes each output file
+    itself, so rendered bytes never pass through Python.
+
+    Rendered files are linked into the render cache, keyed by a hash of the DOT
+    source and dpi; formats already cached are linked back out instead of being
+    passed to dot, and dot is not run at all when every format is a cache hit.
+
+    Args:
+        dot_string: DOT source to render
+        formats: Output formats, each "png" or "pdf"
+        graph_id: Graph ID for filename
+        dpi: Optional output resolution (Graphviz default: 96 for PNG)
+
+    Returns:
+        Mapping of format to path of the rendered file
+
+    Raises:
+        ValueError: If any format is not "png" or "pdf", or dpi is not positive
+        RuntimeError: If Graphviz is not installed, lacks a format, or rendering fails
+    """
+    for export_format in formats:
+        if export_format not in IMAGE_FORMATS:
+            raise ValueError(f"Invalid image format: {export_format}. Must be 'png' or 'pdf'.")
+    if dpi is not None and dpi <= 0:
+        raise ValueError(f"Invalid dpi: {dpi}. Must be a positive integer.")
+    _require_dot_formats(formats)
+
+    logger.info(f"Rendering graph {graph_id} to {', '.join(f.upper() for f in formats)} format")
+
+    # Create graph-specific subdirectory under the exports directory
+    graph_export_dir = get_exports_directory() / str(graph_id)
+    graph_export_dir.mkdir(parents=True, exist_ok=True)
+
+    output_paths = {
+        export_format: graph_export_dir / f"graph_{graph_id}.{export_format}"
+        for export_format in formats
+    }
+
+    dot_bytes = dot_string.encode()
+    cache_dir = graph_export_dir.parent / RENDER_CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    cache_key = _render_cache_key(dot_bytes, dpi)
+    cache_paths = {
+        export_format: cache_dir / f"{cache_key}.{export_format}" for export_format in formats
+    }
+
+    to_render = {}
+    for export_format, output_path in output_paths.items():
+        cache_path = cache_paths[export_format]
+        try:
+            _link_file(cache_path, output_path)
+            os.utime(cache_path)
+        except FileNotFoundError:
+            to_render[export_format] = output_path
+        else:
+            logger.info(f"Reused cached {export_format.upper()} render for graph {graph_id}")
+
+    if not to_render:
+        return output_paths
+
+    args = [] if dpi is None else [f"-Gdpi={dpi}"]
+    for export_format, output_path in to_render.items():
+        # dot truncates in place; never write through a link shared with the cache
+        output_path.unlink(missing_ok=True)
+        args += [f"-T{export_format}", "-o", str(output_path)]
+
+    _run_dot(args, dot_bytes)
+
+    for export_format, output_path in to_render.items():
+        if not output_path.exists():
+            raise RuntimeError(f"Rendering succeeded but output file not found: {output_path}")
+
+        file_size = output_path.stat().st_size
+        logger.info(f"Rendered graph {graph_id} to {export_format.upper()}: {file_size} bytes")
+
+        try:
+            _link_file(output_path, cache_paths[export_format])
+        except OSError as e:
+            logger.warning(f"Failed to cache {export_format.upper()} render: {e}")
+
+    _evict_render_cache(cache_dir)
+    return output_paths
+
+
+def _render_cache_key(dot_bytes: bytes, dpi: int | None) -> str:
+    """Content-address a render by its DOT source and resolution."""
+    digest = hashlib.blake2b(dot_bytes, digest_size=16).hexdigest()
+    return digest if dpi is None else f"{digest}-{dpi}dpi"
+
+
+def _link_file(src: Path, dst: Path) -> None:
+    """
+    Atomically place src at dst as a hard link, copying where links are unsupported.
+
+    The temporary name is unique per call, so concurrent exports of the same graph
+    (the sync export endpoint runs in FastAPI's threadpool) never share one.
+
+    Raises:
+        FileNotFoundError: If src does not exist
+        FileExistsError: If the temporary name is unexpectedly taken
+    """
+    tmp_path = dst.with_name(f"{dst.name}.{uuid.uuid4().hex}{_LINK_TMP_SUFFIX}")
+    try:
+        os.link(src, tmp_path)
+    except (FileNotFoundError, FileExistsError):
+        raise
+    except OSError:
+        # Cross-device storage or a filesystem without hard links
+        shutil.copyfile(src, tmp_path)
+    try:
+        os.replace(tmp_path, dst)
+    finally:
+        # rename() leaves tmp_path in place when it already links the same file as dst
+        tmp_path.unlink(missing_ok=True)
+
+
+def _evict_render_cache(cache_dir: Path) -> None:
+    """Delete the least recently used renders beyond RENDER_CACHE_SIZE."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        # In-flight _link_file temporaries are not cache entries
+        if entry.name.endswith(_LINK_TMP_SUFFIX):
+            continue
+        try:
+            entries.append((entry.stat().st_mtime, entry.path))
+        except FileNotFoundError:
+            continue
+    if len(entries) <= RENDER_CACHE_SIZE:
+        return
+
+    entries.sort()
+    for _, path in entries[: len(entries) - RENDER_CACHE_SIZE]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def export_as_images(
+    graph_json: dict[str, Any],
+    formats: list[str],
+    graph_id: int,
+    dpi: int | None = None,
+    dot_source: str | None = None,
+) -> dict[str, Path]:
+    """
+    Generate PNG and/or PDF exports using one Graphviz invocation.
+
+    Builds the DOT string once for all formats (or reuses dot_source, when the
+    caller already has it) and renders it with _render_dot_files (caller must
+    clean up the returned files).
+
+    Args:
+        graph_json: Canonical graph structure
+        formats: Output formats, each "png" or "pdf"
+        graph_id: Graph ID for filename
+        dpi: Optional output resolution (Graphviz default: 96 for PNG)
+        dot_source: DOT already built from graph_json, to skip rebuilding it
+
+    Returns:
+        Mapping of format to path of the rendered file
+
+    Raises:
+        ValueError: If any format is not "png" or "pdf", or dpi is not positive
+        RuntimeError: If Graphviz is not installed or rendering fails
+        OSError: If file I/O errors occur
+    """
+    for export_format in formats:
+        if export_format not in IMAGE_FORMATS:
+            raise ValueError(f"Invalid image format: {export_format}. Must be 'png' or 'pdf'.")
+
+    if dot_source is None:
+        dot_source = build_dot_from_canonical_graph(graph_json)
+    return _render_dot_files(dot_source, formats, graph_id, dpi=dpi)
+
+
+def export_as_image(
+    graph_json: dict[str, Any],
+    export_format: str,
+    graph_id: int,
+    dpi: int | None = None,
+    dot_source: str | None = None,
+) -> Path:
     """
     Generate PNG or PDF format export using Graphviz rendering.
 
-    This function:
-    1. Builds DOT string from canonical graph
-    2. Creates Graphviz Source object
-    3. Renders to PNG or PDF file
-    4. Returns path to rendered file (caller must clean up)
+    Single-format convenience wrapper around export_as_images.
 
     System Graphviz must be installed:
     - Debian/Ubuntu: apt-get install graphviz
@@ -271,84 +845,134 @@ def export_as_image(graph_json: dict[str, Any], export_format: str, graph_id: in
         graph_json: Canonical graph structure
         export_format: Output format ("png" or "pdf")
         graph_id: Graph ID for filename
+        dpi: Optional output resolution (Graphviz default: 96 for PNG)
+        dot_source: DOT already built from graph_json, to skip rebuilding it
 
     Returns:
         Path to rendered file
 
     Raises:
-        ValueError: If export_format is not "png" or "pdf"
+        ValueError: If export_format is not "png" or "pdf", or dpi is not positive
         RuntimeError: If Graphviz is not installed or rendering fails
         OSError: If file I/O errors occur
     """
-    if export_format not in {"png", "pdf"}:
-        raise ValueError(f"Invalid image format: {export_format}. Must be 'png' or 'pdf'.")
+    paths = export_as_images(graph_json, [export_format], graph_id, dpi=dpi, dot_source=dot_source)
+    return paths[export_format]
 
-    logger.info(f"Rendering graph {graph_id} to {export_format.upper()} format")
 
-    try:
-        # Build DOT string
-        dot_string = build_dot_from_canonical_graph(graph_json)
+def create_export_archive(
+    graph_json: dict[str, Any],
+    graph_id: int,
+    formats: list[str] | None = None,
+    filters: dict[str, Any] | None = None,
+) -> Path:
+    """
+    Bundle several export formats of one graph into a single .zip archive.
 
-        # Create Graphviz Source object
-        source = graphviz.Source(dot_string, format=export_format)
+    The DOT source is built once and shared by the DOT entry and every rendered
+    image format. Image formats are rendered concurrently, each piped from
+    Graphviz stdout into its zip entry, so no intermediate image files are written.
 
-        # Get exports directory
-        exports_dir = get_exports_directory()
+    Archive entries are named graph.<format>, plus a metadata.json describing the
+    export (graph ID, creation time, generator, formats, filters, counts). The
+    archive is written to STORAGE_ROOT/exports/{graph_id}/graph_{graph_id}.zip
+    (caller must clean up).
 
-        # Create graph-specific subdirectory
-        graph_export_dir = exports_dir / str(graph_id)
-        graph_export_dir.mkdir(parents=True, exist_ok=True)
+    Args:
+        graph_json: Canonical graph structure
+        graph_id: Graph ID for filename
+        formats: Export formats to include (default: all of dot, json, png, pdf)
+        filters: Optional apply_graph_filters keyword arguments (host, index,
+            protocol, roles), applied once before any format is generated
 
-        # Generate output filename
-        output_name = f"graph_{graph_id}"
+    Returns:
+        Path to the created archive
 
-        # Render to file (cleanup=True removes intermediate .dot file)
-        source.render(
-            filename=output_name,
-            directory=str(graph_export_dir),
-            format=export_format,
-            cleanup=True,
-        )
+    Raises:
+        ValueError: If a format is invalid
+        RuntimeError: If Graphviz is not installed or rendering fails
+        OSError: If file I/O errors occur
+    """
+    if formats is None:
+        formats = list(ARCHIVE_FORMATS)
+    formats = [validate_export_format(export_format) for export_format in formats]
 
-        # Return path to rendered file
-        output_path = graph_export_dir / f"{output_name}.{export_format}"
+    # Filter first so every format is generated from the kept hosts/edges only
+    if filters:
+        graph_json = apply_graph_filters(graph_json, **filters)
 
-        if not output_path.exists():
-            raise RuntimeError(f"Rendering succeeded but output file not found: {output_path}")
+    # Built once; shared by the .dot entry and all rendered images
+    dot_string = build_dot_from_canonical_graph(graph_json)
 
-        file_size = output_path.stat().st_size
-        logger.info(f"Rendered graph {graph_id} to {export_format.upper()}: {file_size} bytes")
+    graph_export_dir = get_exports_directory() / str(graph_id)
+    graph_export_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = graph_export_dir / f"graph_{graph_id}.zip"
 
-        return output_path
+    image_formats = [f for f in ARCHIVE_FORMATS if f in formats and f in IMAGE_FORMATS]
 
-    except ExecutableNotFound as e:
-        logger.error(f"Graphviz not found: {e}")
-        raise RuntimeError(
-            "Graphviz is not installed. Please install system Graphviz: "
-            "apt-get install graphviz (Debian/Ubuntu) or "
-            "apk add graphviz (Alpine) or "
-            "brew install graphviz (macOS)"
-        ) from e
-
-    except CalledProcessError as e:
-        logger.error(f"Graphviz rendering failed: {e}")
-        logger.debug(f"DOT content:\n{dot_string}")
-        raise RuntimeError(f"Graphviz rendering failed: {e}") from e
-
-    except OSError as e:
-        logger.error(f"File I/O error during export: {e}")
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=max(len(image_formats), 1)) as executor,
+            zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf,
+        ):
+            # Start every Graphviz render up front; dot runs out of process, so the
+            # renders overlap each other and the DOT/JSON entries written below
+            dot_bytes = dot_string.encode()
+            renders = {
+                export_format: executor.submit(_pipe_dot, dot_bytes, export_format)
+                for export_format in image_formats
+            }
+
+            if "dot" in formats:
+                zf.writestr("graph.dot", dot_string)
+            if "json" in formats:
+                with zf.open("graph.json", "w") as json_entry:
+                    write_json_stream(graph_json, json_entry)
+            # Collected in format order so entry order is deterministic
+            for export_format, render in renders.items():
+                zf.writestr(
+                    f"graph.{export_format}",
+                    render.result(),
+                    compress_type=ARCHIVE_COMPRESSION[export_format],
+                )
+
+            metadata = {
+                "graph_id": graph_id,
+                "created_at": datetime.now(UTC),
+                "generator": GENERATOR,
+                "formats": formats,
+                # Set-valued filters (e.g. roles) are listed in sorted order
+                "filters": {
+                    key: sorted(value) if isinstance(value, set | frozenset) else value
+                    for key, value in (filters or {}).items()
+                },
+                "host_count": len(graph_json.get("hosts", [])),
+                "edge_count": len(graph_json.get("edges", [])),
+            }
+            # orjson encodes datetimes natively
+            zf.writestr("metadata.json", orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    except Exception:
+        # Don't leave a partial archive behind
+        archive_path.unlink(missing_ok=True)
         raise
 
+    logger.info(
+        f"Created export archive for graph {graph_id} ({', '.join(formats)}): "
+        f"{archive_path.stat().st_size} bytes"
+    )
+    return archive_path
+
 
 def export_graph(
     graph_json: dict[str, Any], export_format: str, graph_id: int
-) -> tuple[str | Path, str]:
+) -> tuple[str | bytes | Path, str]:
     """
     Main export function that routes to appropriate format handler.
 
     This function validates the format and delegates to the appropriate
     export handler. It returns a tuple of (content_or_path, media_type):
-    - For DOT/JSON: content is string
+    - For DOT: content is string
+    - For JSON: content is UTF-8 bytes, ready to send without re-encoding
     - For PNG/PDF: content is Path to file (caller must clean up)
 
     Args:
@@ -358,7 +982,7 @@ def export_graph(
 
     Returns:
         Tuple of (content_or_path, media_type):
-        - content_or_path: String content or Path to file
+        - content_or_path: String/bytes content or Path to file
         - media_type: MIME type for HTTP response
 
     Raises:
@@ -375,8 +999,7 @@ def export_graph(
         return (content, "text/vnd.graphviz")
 
     elif format_lower == "json":
-        content = export_as_json(graph_json)
-        return (content, "application/json")
+        return (export_as_json_bytes(graph_json), "application/json")
 
     elif format_lower == "png":
         file_path = export_as_image(graph_json, "png", graph_id)
@@ -31,6 +31,7 @@ Usage:
 import configparser
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -48,13 +49,35 @@ PRECEDENCE_LAYERS = [
 ]
 
 # Sensitive keys to redact (case-insensitive matching)
-SENSITIVE_KEYS = {"pass4symmkey", "sslpassword", "password", "token", "secret"}
+SENSITIVE_KEYS = frozenset({"pass4symmkey", "sslpassword", "password", "token", "secret"})
 
 # Configuration file names
 CONF_FILES = ["inputs.conf", "outputs.conf", "props.conf", "transforms.conf"]
 
-
-@dataclass
+# Sections parse_splunk_config can parse (selectable via its include argument)
+PARSE_SECTIONS = ("inputs", "outputs", "props", "transforms")
+
+# Boolean setting values Splunk treats as true (compared lowercased)
+TRUE_VALUES = frozenset({"1", "true", "yes"})
+
+# Stanza name patterns, compiled once at import rather than per parse call
+_MONITOR_PATTERN = re.compile(r"^monitor://(.+)$")
+_TCP_PATTERN = re.compile(r"^tcp://(?:[^:]*:)?(\d+)$")
+_UDP_PATTERN = re.compile(r"^udp://(?:[^:]*:)?(\d+)$")
+_SPLUNKTCP_PATTERN = re.compile(r"^splunktcp://(?:[^:]*:)?(\d+)$")
+_HTTP_PATTERN = re.compile(r"^http(?:://(.+))?$")
+_SCRIPT_PATTERN = re.compile(r"^script://(.+)$")
+_WINEVENTLOG_PATTERN = re.compile(r"^WinEventLog://(.+)$", re.IGNORECASE)
+_INDEXER_DISCOVERY_PATTERN = re.compile(r"^indexer_discovery:(.+)$")
+_TCPOUT_PATTERN = re.compile(r"^tcpout:(.+)$")
+_TCPOUT_SERVER_PATTERN = re.compile(r"^tcpout-server://(.+)$")
+_SOURCETYPE_PATTERN = re.compile(r"^sourcetype::(.+)$")
+_SOURCE_PATTERN = re.compile(r"^source::(.+)$")
+_HOST_PATTERN = re.compile(r"^host::(.+)$")
+_TRANSFORMS_KEY_PATTERN = re.compile(r"^TRANSFORMS-(.+)$", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class InputStanza:
     """Represents a parsed input stanza from inputs.conf.
 
@@ -80,7 +103,7 @@ class InputStanza:
     source_apps: list[str | None] = field(default_factory=list)  # All contributing source apps
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputGroup:
     """Represents a parsed tcpout group from outputs.conf.
 
@@ -105,7 +128,7 @@ class OutputGroup:
     source_apps: list[str | None] = field(default_factory=list)  # All contributing source apps
 
 
-@dataclass
+@dataclass(slots=True)
 class PropsStanza:
     """Represents a parsed props stanza from props.conf.
 
@@ -129,7 +152,7 @@ class PropsStanza:
     source_apps: list[str | None] = field(default_factory=list)  # All contributing source apps
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformStanza:
     """Represents a parsed transform stanza from transforms.conf.
 
@@ -158,7 +181,7 @@ class TransformStanza:
     source_apps: list[str | None] = field(default_factory=list)  # All contributing source apps
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedConfig:
     """Top-level container for all parsed Splunk configurations.
 
@@ -346,40 +369,31 @@ def parse_inputs_conf(work_dir: Path) -> list[InputStanza]:
     merged = merge_conf_layers(conf_files, "inputs.conf", work_dir)
     inputs: list[InputStanza] = []
 
-    # Regex patterns for input type extraction
-    monitor_pattern = re.compile(r"^monitor://(.+)$")
-    tcp_pattern = re.compile(r"^tcp://(?:[^:]*:)?(\d+)$")
-    udp_pattern = re.compile(r"^udp://(?:[^:]*:)?(\d+)$")
-    splunktcp_pattern = re.compile(r"^splunktcp://(?:[^:]*:)?(\d+)$")
-    http_pattern = re.compile(r"^http(?:://(.+))?$")
-    script_pattern = re.compile(r"^script://(.+)$")
-    wineventlog_pattern = re.compile(r"^WinEventLog://(.+)$", re.IGNORECASE)
-
     for stanza_name, stanza_data in merged.items():
         input_type = "modular"  # Default for unknown types
         source_path: str | None = None
         port: int | None = None
 
         # Extract input type and parameters from stanza name
-        if match := monitor_pattern.match(stanza_name):
+        if match := _MONITOR_PATTERN.match(stanza_name):
             input_type = "monitor"
             source_path = match.group(1)
-        elif match := tcp_pattern.match(stanza_name):
+        elif match := _TCP_PATTERN.match(stanza_name):
             input_type = "tcp"
             port = int(match.group(1))
-        elif match := udp_pattern.match(stanza_name):
+        elif match := _UDP_PATTERN.match(stanza_name):
             input_type = "udp"
             port = int(match.group(1))
-        elif match := splunktcp_pattern.match(stanza_name):
+        elif match := _SPLUNKTCP_PATTERN.match(stanza_name):
             input_type = "splunktcp"
             port = int(match.group(1))
-        elif match := http_pattern.match(stanza_name):
+        elif match := _HTTP_PATTERN.match(stanza_name):
             input_type = "http"
             source_path = match.group(1)  # HEC token name
-        elif match := script_pattern.match(stanza_name):
+        elif match := _SCRIPT_PATTERN.match(stanza_name):
             input_type = "script"
             source_path = match.group(1)
-        elif match := wineventlog_pattern.match(stanza_name):
+        elif match := _WINEVENTLOG_PATTERN.match(stanza_name):
             input_type = "WinEventLog"
             source_path = match.group(1)
 
@@ -388,7 +402,7 @@ def parse_inputs_conf(work_dir: Path) -> list[InputStanza]:
         index = stanza_data.get("index")
         host = stanza_data.get("host")
         disabled_value = stanza_data.get("disabled", "false").lower()
-        disabled = disabled_value in ("1", "true", "yes")
+        disabled = disabled_value in TRUE_VALUES
 
         # Extract source file and app metadata
         source_file = stanza_data.get("_source_file", "")
@@ -461,9 +475,8 @@ def parse_outputs_conf(work_dir: Path) -> list[OutputGroup]:
 
     # Parse indexer_discovery stanzas first to build discovery mapping
     indexer_discovery_map: dict[str, dict[str, Any]] = {}
-    indexer_discovery_pattern = re.compile(r"^indexer_discovery:(.+)$")
     for stanza_name, stanza_data in merged.items():
-        if match := indexer_discovery_pattern.match(stanza_name):
+        if match := _INDEXER_DISCOVERY_PATTERN.match(stanza_name):
             discovery_name = match.group(1)
             # Extract key indexer discovery settings
             indexer_discovery_map[discovery_name] = {
@@ -496,9 +509,8 @@ def parse_outputs_conf(work_dir: Path) -> list[OutputGroup]:
             }
 
     # Parse tcpout groups
-    tcpout_pattern = re.compile(r"^tcpout:(.+)$")
     for stanza_name, stanza_data in merged.items():
-        if match := tcpout_pattern.match(stanza_name):
+        if match := _TCPOUT_PATTERN.match(stanza_name):
             group_name = match.group(1)
 
             # Parse server list (comma-separated host:port)
@@ -518,7 +530,7 @@ def parse_outputs_conf(work_dir: Path) -> list[OutputGroup]:
             # Normalize useSSL to boolean
             use_ssl_bool = None
             if use_ssl_str is not None:
-                use_ssl_bool = use_ssl_str.lower() in ("1", "true", "yes")
+                use_ssl_bool = use_ssl_str.lower() in TRUE_VALUES
 
             # Determine if SSL/TLS is enabled
             ssl_enabled = None
@@ -533,12 +545,12 @@ def parse_outputs_conf(work_dir: Path) -> list[OutputGroup]:
             compressed_str = stanza_data.get("compressed")
             compressed = None
             if compressed_str is not None:
-                compressed = compressed_str.lower() in ("1", "true", "yes")
+                compressed = compressed_str.lower() in TRUE_VALUES
 
             use_ack_str = stanza_data.get("useACK")
             use_ack = None
             if use_ack_str is not None:
-                use_ack = use_ack_str.lower() in ("1", "true", "yes")
+                use_ack = use_ack_str.lower() in TRUE_VALUES
 
             # Extract indexer discovery
             indexer_discovery = stanza_data.get("indexerDiscovery")
@@ -598,10 +610,9 @@ def parse_outputs_conf(work_dir: Path) -> list[OutputGroup]:
             )
 
     # Parse tcpout-server stanzas for per-server overrides
-    tcpout_server_pattern = re.compile(r"^tcpout-server://(.+)$")
     server_overrides: dict[str, dict[str, Any]] = {}
     for stanza_name, stanza_data in merged.items():
-        if match := tcpout_server_pattern.match(stanza_name):
+        if match := _TCPOUT_SERVER_PATTERN.match(stanza_name):
             server_endpoint = match.group(1)
             # Extract all settings except metadata
             server_settings = {k: v for k, v in stanza_data.items() if not k.startswith("_source")}
@@ -640,11 +651,6 @@ def parse_props_conf(work_dir: Path) -> list[PropsStanza]:
     merged = merge_conf_layers(conf_files, "props.conf", work_dir)
     props: list[PropsStanza] = []
 
-    # Regex patterns for stanza type extraction
-    sourcetype_pattern = re.compile(r"^sourcetype::(.+)$")
-    source_pattern = re.compile(r"^source::(.+)$")
-    host_pattern = re.compile(r"^host::(.+)$")
-
     for stanza_name, stanza_data in merged.items():
         stanza_type = "sourcetype"  # Default for plain stanzas
         stanza_value = stanza_name
@@ -653,21 +659,20 @@ def parse_props_conf(work_dir: Path) -> list[PropsStanza]:
         if stanza_name == "default":
             stanza_type = "default"
             stanza_value = "default"
-        elif match := sourcetype_pattern.match(stanza_name):
+        elif match := _SOURCETYPE_PATTERN.match(stanza_name):
             stanza_type = "sourcetype"
             stanza_value = match.group(1)
-        elif match := source_pattern.match(stanza_name):
+        elif match := _SOURCE_PATTERN.match(stanza_name):
             stanza_type = "source"
             stanza_value = match.group(1)
-        elif match := host_pattern.match(stanza_name):
+        elif match := _HOST_PATTERN.match(stanza_name):
             stanza_type = "host"
             stanza_value = match.group(1)
 
         # Extract TRANSFORMS-* keys (preserve order)
         transforms: list[str] = []
-        transforms_pattern = re.compile(r"^TRANSFORMS-(.+)$", re.IGNORECASE)
         for key, value in stanza_data.items():
-            if transforms_pattern.match(key):
+            if _TRANSFORMS_KEY_PATTERN.match(key):
                 # Value can be comma-separated list of transform names
                 transform_names = [t.strip() for t in value.split(",") if t.strip()]
                 transforms.extend(transform_names)
@@ -701,7 +706,7 @@ def parse_props_conf(work_dir: Path) -> list[PropsStanza]:
                 "_source_app",
                 "_source_apps",
             }
-            and not transforms_pattern.match(k)
+            and not _TRANSFORMS_KEY_PATTERN.match(k)
         }
 
         props.append(
@@ -829,7 +834,9 @@ def parse_transforms_conf(work_dir: Path) -> list[TransformStanza]:
     return transforms
 
 
-def parse_splunk_config(job_id: int, work_dir: Path | None = None) -> ParsedConfig:
+def parse_splunk_config(
+    job_id: int, work_dir: Path | None = None, *, include: Iterable[str] = PARSE_SECTIONS
+) -> ParsedConfig:
     """Parse all Splunk configuration files for a job and return merged configurations.
 
     Main entry point for configuration parsing. Applies precedence rules across all
@@ -839,14 +846,21 @@ def parse_splunk_config(job_id: int, work_dir: Path | None = None) -> ParsedConf
         job_id: Job ID to parse configurations for.
         work_dir: Optional work directory path. If not provided, will use
             get_work_directory(job_id).
+        include: Sections of PARSE_SECTIONS to parse (default: all). Skipped sections
+            are left empty and get no *_count metadata; hostname and apps metadata
+            are always collected, so include=() reads host metadata only.
 
     Returns:
         ParsedConfig containing all inputs, outputs, props, transforms with metadata.
 
     Raises:
         FileNotFoundError: If work directory does not exist.
-        ValueError: If no configuration files are found.
+        ValueError: If include names an unknown section.
     """
+    include = frozenset(include)
+    if unknown := include.difference(PARSE_SECTIONS):
+        raise ValueError(f"Unknown config sections: {', '.join(sorted(unknown))}")
+
     logger.info(f"Starting Splunk configuration parsing for job_id={job_id}")
 
     # Get work directory from storage service or use provided one
@@ -857,11 +871,11 @@ def parse_splunk_config(job_id: int, work_dir: Path | None = None) -> ParsedConf
 
     logger.debug(f"Work directory: {work_dir}")
 
-    # Parse all configuration types
-    inputs = parse_inputs_conf(work_dir)
-    outputs = parse_outputs_conf(work_dir)
-    props = parse_props_conf(work_dir)
-    transforms = parse_transforms_conf(work_dir)
+    # Parse the requested configuration types
+    inputs = parse_inputs_conf(work_dir) if "inputs" in include else []
+    outputs = parse_outputs_conf(work_dir) if "outputs" in include else []
+    props = parse_props_conf(work_dir) if "props" in include else []
+    transforms = parse_transforms_conf(work_dir) if "transforms" in include else []
 
     # Build host metadata
     host_metadata: dict[str, Any] = {
@@ -887,11 +901,15 @@ def parse_splunk_config(job_id: int, work_dir: Path | None = None) -> ParsedConf
         host_metadata["apps"] = sorted(apps_found)
         host_metadata["app_count"] = len(apps_found)
 
-    # Count stanzas by type
-    host_metadata["input_count"] = len(inputs)
-    host_metadata["output_count"] = len(outputs)
-    host_metadata["props_count"] = len(props)
-    host_metadata["transforms_count"] = len(transforms)
+    # Count stanzas by type (parsed sections only)
+    for section, count_key, stanzas in (
+        ("inputs", "input_count", inputs),
+        ("outputs", "output_count", outputs),
+        ("props", "props_count", props),
+        ("transforms", "transforms_count", transforms),
+    ):
+        if section in include:
+            host_metadata[count_key] = len(stanzas)
 
     # Build traceability map
     traceability: dict[str, list[str]] = {}
@@ -1,45 +1,96 @@
 """Pytest configuration with shared fixtures for all tests."""
 
+import hashlib
+import importlib
+import io
+import json
+import os
 import shutil
+import struct
 import tarfile
-import zipfile
-from collections.abc import Generator
+import zlib
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
+from functools import cache, partial
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
-from sqlalchemy import create_engine, event
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Text, create_engine, event, insert, type_coerce
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.config import settings
-from app.database import Base
+from app.database import Base, _current_test_session
 from app.models.finding import Finding
 from app.models.graph import Graph
 from app.models.job import Job
 from app.models.project import Project
 from app.models.upload import Upload
-
-# Import golden config creators
-from tests.fixtures.splunk_configs import (
-    create_ambiguous_routing_config,
-    create_dangling_output_config,
-    create_hec_config,
-    create_hf_config,
-    create_idx_config,
-    create_indexer_discovery_config,
-    create_precedence_test_config,
-    create_uf_config,
+from app.services.parser import ParsedConfig, parse_splunk_config
+
+# Schema DDL compiled once at import and replayed with a single executescript call,
+# instead of Base.metadata.create_all inspecting and compiling every table per engine.
+_SQLITE_DIALECT = sqlite.dialect()
+DDL_SQL = "".join(
+    f"{str(CreateTable(table).compile(dialect=_SQLITE_DIALECT)).strip()};\n"
+    for table in Base.metadata.sorted_tables
+) + "".join(
+    f"{CreateIndex(index).compile(dialect=_SQLITE_DIALECT)};\n"
+    for table in Base.metadata.sorted_tables
+    for index in sorted(table.indexes, key=lambda index: index.name)
 )
 
 
-@pytest.fixture(scope="function")
+class _TestSession(Session):
+    """Session class for test_db, so the savepoint listener never sees app sessions."""
+
+
+def _restart_savepoint(session: Session, transaction) -> None:
+    """After each commit/rollback in the tested code, start a new savepoint."""
+    if transaction.nested and not transaction._parent.nested:
+        session.begin_nested()
+
+
+# Registered once on the class rather than per test session instance
+event.listen(_TestSession, "after_transaction_end", _restart_savepoint)
+
+
+@cache
+def _golden_configs():
+    """Import the golden config module on first use, so collection doesn't pay for it."""
+    return importlib.import_module("tests.fixtures.splunk_configs")
+
+
+@pytest.fixture(scope="session")
 def test_db_engine():
-    """Create in-memory SQLite engine for fast tests."""
+    """Create in-memory SQLite engine once per test session.
+
+    Schema creation is paid once; per-test isolation comes from the outer
+    transaction + SAVEPOINT pattern in ``test_db_session``.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         echo=False,
-        connect_args={"check_same_thread": False},  # Allow TestClient to use connection across threads
+        connect_args={"check_same_thread": False},  # Sync endpoints run in a threadpool
+        poolclass=StaticPool,  # One shared connection, so every checkout sees the same database
     )
-    Base.metadata.create_all(engine)
+
+    # pysqlite defers BEGIN until the first DML statement, so a SAVEPOINT would open
+    # (and RELEASE would commit) the real transaction. Take over transaction control
+    # so the outer per-test transaction actually wraps every savepoint.
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    with engine.connect() as connection:
+        connection.connection.driver_connection.executescript(DDL_SQL)
     yield engine
     engine.dispose()
 
@@ -49,17 +100,11 @@ def test_db_session(test_db_engine) -> Generator[Session, None, None]:
     """Provide clean database session for each test with automatic rollback."""
     connection = test_db_engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection, expire_on_commit=False)
+    session = _TestSession(bind=connection, expire_on_commit=False)
 
     # Enable savepoints so that router commits don't conflict with test rollback
     session.begin_nested()
 
-    # After each commit/rollback in the tested code, start a new savepoint
-    @event.listens_for(session, "after_transaction_end")
-    def restart_savepoint(session, transaction):
-        if transaction.nested and not transaction._parent.nested:
-            session.begin_nested()
-
     yield session
 
     session.close()
@@ -74,19 +119,188 @@ def test_db(test_db_session) -> Session:
 
 
 @pytest.fixture(scope="function")
-def temp_storage_root(tmp_path: Path, monkeypatch) -> Path:
+def bind_test_db(test_db: Session) -> Generator[Session, None, None]:
+    """Make the app's get_db yield this test's database session."""
+    token = _current_test_session.set(test_db)
+    yield test_db
+    _current_test_session.reset(token)
+
+
+@pytest.fixture(scope="function")
+async def client(bind_test_db: Session) -> AsyncGenerator[AsyncClient, None]:
+    """Async HTTP client driving the app in-process, with get_db bound to this test's session.
+
+    Requests go straight through ASGITransport on the test's event loop, so a test can
+    issue concurrent requests with asyncio.gather.
+    """
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def _storage_session_root(tmp_path_factory) -> Path:
+    """Root directory under which every test gets its own storage sandbox."""
+    return tmp_path_factory.mktemp("storage")
+
+
+@pytest.fixture(scope="function")
+def temp_storage_root(_storage_session_root: Path, request, monkeypatch) -> Path:
     """Create temporary directory for file operations."""
-    storage_root = tmp_path / "storage"
-    storage_root.mkdir(parents=True, exist_ok=True)
+    node_hash = hashlib.sha1(request.node.nodeid.encode()).hexdigest()[:16]
+    storage_root = _storage_session_root / node_hash
+    # A rerun of the same test must not see files left by the previous attempt
+    shutil.rmtree(storage_root, ignore_errors=True)
+    storage_root.mkdir()
     monkeypatch.setattr(settings, "storage_root", str(storage_root))
     return storage_root
 
 
+# Fixed DOS timestamp (1980-01-01 00:00) keeps golden archives byte-for-byte reproducible
+_ZIP_DOS_TIME = 0
+_ZIP_DOS_DATE = (1 << 5) | 1
+_ZIP_VERSION = 20  # 2.0: minimum version for plain stored entries
+_ZIP_HOST_UNIX = 3  # "Version made by" host byte: external attributes hold Unix mode bits
+
+
+def _write_stored_zip(archive_path: Path, entries: Iterable[tuple[str, bytes]]) -> None:
+    """
+    Write a stored-only (uncompressed) zip archive with one buffered write per entry.
+
+    Emits the local file headers, central directory and end-of-central-directory record
+    directly instead of going through zipfile.ZipFile, whose per-entry bookkeeping
+    dominates for the sub-kilobyte golden .conf payloads.
+
+    Args:
+        archive_path: Destination zip file
+        entries: (archive name, content) pairs
+    """
+    central_directory = []
+    offset = 0
+    with open(archive_path, "wb", buffering=1 << 20) as f:
+        for name, data in entries:
+            encoded_name = name.encode()
+            crc = zlib.crc32(data)
+            size = len(data)
+            header = struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,  # Local file header signature
+                _ZIP_VERSION,
+                0,  # Flags
+                0,  # Compression: stored
+                _ZIP_DOS_TIME,
+                _ZIP_DOS_DATE,
+                crc,
+                size,
+                size,
+                len(encoded_name),
+                0,  # Extra field length
+            )
+            f.write(header + encoded_name + data)
+            central_directory.append(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII",
+                    0x02014B50,  # Central directory header signature
+                    _ZIP_HOST_UNIX << 8 | _ZIP_VERSION,  # Version made by
+                    _ZIP_VERSION,  # Version needed to extract
+                    0,
+                    0,
+                    _ZIP_DOS_TIME,
+                    _ZIP_DOS_DATE,
+                    crc,
+                    size,
+                    size,
+                    len(encoded_name),
+                    0,  # Extra field length
+                    0,  # Comment length
+                    0,  # Disk number start
+                    0,  # Internal attributes
+                    0o100644 << 16,  # External attributes: regular file, rw-r--r--
+                    offset,
+                )
+                + encoded_name
+            )
+            offset += len(header) + len(encoded_name) + size
+
+        central_directory_bytes = b"".join(central_directory)
+        end_record = struct.pack(
+            "<IHHHHIIH",
+            0x06054B50,  # End of central directory signature
+            0,
+            0,
+            len(central_directory),
+            len(central_directory),
+            len(central_directory_bytes),
+            offset,
+            0,  # Comment length
+        )
+        f.write(central_directory_bytes + end_record)
+
+
+def _build_archive(config_creator_func, dest_dir: Path, archive_format: str) -> Path:
+    """
+    Build an archive from a golden config creator function into dest_dir.
+
+    Entries are written straight from the golden config mapping, so no scratch
+    config tree is created on disk and nothing has to be re-discovered by a walk.
+
+    Args:
+        config_creator_func: Function from splunk_configs.py (e.g., create_uf_config)
+        dest_dir: Directory the archive is written to
+        archive_format: "zip" or "tar.gz"
+
+    Returns:
+        Path to created archive file
+    """
+    if archive_format not in ("zip", "tar.gz"):
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create archive. The .conf payloads are tiny, so compression buys nothing;
+    # tar.gz keeps gzip framing because extract_archive opens it with "r:gz".
+    archive_path = dest_dir / f"upload.{archive_format}"
+    config_files = _golden_configs().GOLDEN_CONFIG_FILES[config_creator_func]
+    if archive_format == "zip":
+        _write_stored_zip(archive_path, config_files.items())
+    else:
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tarf:
+            for rel_path, content in config_files.items():
+                member = tarfile.TarInfo(rel_path)
+                member.size = len(content)
+                member.mode = 0o644
+                tarf.addfile(member, io.BytesIO(content))
+
+    return archive_path
+
+
+@pytest.fixture(scope="session")
+def _archive_cache(tmp_path_factory) -> Callable[[Callable[[Path], Path], str], Path]:
+    """
+    Session-wide cache of golden archives keyed by config creator name + format.
+
+    Each archive is built once per session; callers receive the cached path and
+    link it into their own storage root instead of rebuilding it.
+    """
+    cache_root = tmp_path_factory.mktemp("golden_archives")
+    cache: dict[str, Path] = {}
+
+    def get_archive(config_creator_func: Callable[[Path], Path], archive_format: str) -> Path:
+        key = f"{config_creator_func.__name__}.{archive_format}"
+        if key not in cache:
+            cache[key] = _build_archive(config_creator_func, cache_root / key, archive_format)
+        return cache[key]
+
+    return get_archive
+
+
 def create_archive_from_config(
     config_creator_func,
     storage_root: Path,
     upload_id: int,
     archive_format: str = "zip",
+    archive_cache: Callable[[Callable[[Path], Path], str], Path] | None = None,
 ) -> Path:
     """
     Helper to create a real archive file from golden config creator function.
@@ -96,47 +310,50 @@ def create_archive_from_config(
         storage_root: Root storage directory
         upload_id: Upload ID for organizing artifacts
         archive_format: "zip" or "tar.gz"
+        archive_cache: Optional session archive cache (see ``_archive_cache``); when
+            given, the cached archive is hardlinked instead of rebuilt
 
     Returns:
         Path to created archive file
     """
-    # Create config directory structure
-    config_dir = storage_root / "temp" / f"config_{upload_id}"
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate config files using golden config creator
-    config_creator_func(config_dir)
-
     # Create artifacts directory for upload
     artifacts_dir = storage_root / "artifacts" / str(upload_id)
     artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create archive
-    if archive_format == "zip":
-        archive_path = artifacts_dir / "upload.zip"
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in config_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(config_dir)
-                    zipf.write(file_path, arcname)
-    elif archive_format == "tar.gz":
-        archive_path = artifacts_dir / "upload.tar.gz"
-        with tarfile.open(archive_path, "w:gz") as tarf:
-            tarf.add(config_dir, arcname=".")
-    else:
-        raise ValueError(f"Unsupported archive format: {archive_format}")
+    if archive_cache is None:
+        return _build_archive(config_creator_func, artifacts_dir, archive_format)
 
-    # Clean up temp config directory
-    shutil.rmtree(config_dir)
+    cached_path = archive_cache(config_creator_func, archive_format)
+    archive_path = artifacts_dir / cached_path.name
+    try:
+        os.link(cached_path, archive_path)
+    except OSError:
+        # Cross-device storage roots cannot be hardlinked
+        shutil.copyfile(cached_path, archive_path)
 
     return archive_path
 
 
+@pytest.fixture(scope="session")
+def uf_zip_archive(_archive_cache) -> Path:
+    """Session-cached zip of the UF golden config; copy it before mutating."""
+    return _archive_cache(_golden_configs().create_uf_config, "zip")
+
+
+@pytest.fixture(scope="session")
+def hf_targz_archive(_archive_cache) -> Path:
+    """Session-cached tar.gz of the HF golden config; copy it before mutating."""
+    return _archive_cache(_golden_configs().create_hf_config, "tar.gz")
+
+
 @pytest.fixture(scope="function")
-def create_test_archive():
+def create_test_archive(_archive_cache):
     """
     Fixture factory for creating test archives with golden configs.
 
+    Archives are served from the session archive cache, so repeated requests for
+    the same config creator and format do not rebuild the archive.
+
     Usage in tests:
         archive_path = create_test_archive(
             create_uf_config,
@@ -145,121 +362,272 @@ def create_test_archive():
             archive_format="zip"
         )
     """
-    return create_archive_from_config
+    return partial(create_archive_from_config, archive_cache=_archive_cache)
 
 
-@pytest.fixture(scope="function")
-def sample_project(test_db: Session) -> Project:
-    """Create and return a Project instance in the database."""
-    project = Project(
-        name="Test Project",
-        labels=["test", "sample"],
+@pytest.fixture(scope="session")
+def golden_config_dir(tmp_path_factory) -> Callable[[Callable[[Path], Path]], Path]:
+    """
+    Session-wide cache of golden config trees keyed by config creator name.
+
+    Each tree is written once per session; tests that only read a golden config
+    share it. Tests that add or change files must build their own under tmp_path.
+    """
+    cache_root = tmp_path_factory.mktemp("golden_configs")
+    cache: dict[str, Path] = {}
+
+    def get_config_dir(config_creator_func: Callable[[Path], Path]) -> Path:
+        key = config_creator_func.__name__
+        if key not in cache:
+            cache[key] = config_creator_func(cache_root / key)
+        return cache[key]
+
+    return get_config_dir
+
+
+@pytest.fixture(scope="session")
+def parsed_golden_config(golden_config_dir) -> Callable[[Callable[[Path], Path]], ParsedConfig]:
+    """
+    Session-wide cache of parse_splunk_config(job_id=1) results for golden configs.
+
+    Each golden config is parsed once per session; the ParsedConfig is shared,
+    so tests must not mutate it.
+
+    Usage in tests:
+        parsed = parsed_golden_config(create_uf_config)
+    """
+    cache: dict[str, ParsedConfig] = {}
+
+    def get_parsed(config_creator_func: Callable[[Path], Path]) -> ParsedConfig:
+        key = config_creator_func.__name__
+        if key not in cache:
+            cache[key] = parse_splunk_config(
+                job_id=1, work_dir=golden_config_dir(config_creator_func)
+            )
+        return cache[key]
+
+    return get_parsed
+
+
+@pytest.fixture(scope="session")
+def golden_config_index(
+    parsed_golden_config,
+) -> Callable[[Callable[[Path], Path]], SimpleNamespace]:
+    """
+    Session-wide read-only name -> stanza lookups over parsed golden configs.
+
+    Built in one pass per golden config, so tests look stanzas up by name instead
+    of scanning the parsed lists:
+        inputs_by_stanza, outputs_by_group, props_by_value, transforms_by_name
+
+    Usage in tests:
+        hf_group = golden_config_index(create_uf_config).outputs_by_group["hf_group"]
+    """
+    cache: dict[str, SimpleNamespace] = {}
+
+    def get_index(config_creator_func: Callable[[Path], Path]) -> SimpleNamespace:
+        key = config_creator_func.__name__
+        if key not in cache:
+            parsed = parsed_golden_config(config_creator_func)
+            cache[key] = SimpleNamespace(
+                inputs_by_stanza=MappingProxyType({i.stanza_name: i for i in parsed.inputs}),
+                outputs_by_group=MappingProxyType({o.group_name: o for o in parsed.outputs}),
+                props_by_value=MappingProxyType({p.stanza_value: p for p in parsed.props}),
+                transforms_by_name=MappingProxyType(
+                    {t.stanza_name: t for t in parsed.transforms}
+                ),
+            )
+        return cache[key]
+
+    return get_index
+
+
+# Canonical graph JSON for sample_graph, shared read-only across tests and
+# serialized once rather than per fixture insert
+_GRAPH_JSON_BLOB = MappingProxyType(
+    {
+        "hosts": [
+            {
+                "id": "host1",
+                "roles": ["universal_forwarder"],
+                "labels": [],
+                "apps": ["Splunk_TA_nix"],
+            }
+        ],
+        "edges": [
+            {
+                "src_host": "host1",
+                "dst_host": "indexer1",
+                "protocol": "splunktcp",
+                "sources": ["/var/log/messages"],
+                "sourcetypes": ["syslog"],
+                "indexes": ["main"],
+                "filters": [],
+                "drop_rules": [],
+                "tls": False,
+                "weight": 1,
+                "confidence": "explicit",
+            }
+        ],
+        "meta": {
+            "generator": "test",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "host_count": 1,
+            "edge_count": 1,
+            "source_hosts": ["host1"],
+            "traceability": {},
+        },
+    }
+)
+_GRAPH_JSON_TEXT = json.dumps(dict(_GRAPH_JSON_BLOB))
+
+
+@pytest.fixture(scope="session")
+def _seed_rows() -> SimpleNamespace:
+    """
+    Column values for the sample_* object graph, built once per session.
+
+    The rows are materialized by the sample_* fixtures inside each test's SAVEPOINT
+    rather than committed once, because tests such as test_list_projects_empty rely
+    on starting from an empty database. Foreign keys and storage paths are filled in
+    per test.
+    """
+    return SimpleNamespace(
+        project={
+            "name": "Test Project",
+            "labels": ["test", "sample"],
+        },
+        upload={
+            "filename": "test_config.zip",
+            "status": "completed",
+        },
+        job={
+            "status": "completed",
+            "log": "Job completed successfully",
+        },
+        graph={
+            "version": "1.0",
+            # Pre-serialized: skips the JSON type's json.dumps on every insert
+            "json_blob": type_coerce(_GRAPH_JSON_TEXT, Text()),
+            "meta": {},
+        },
+        finding={
+            "code": "DANGLING_OUTPUT",
+            "severity": "error",
+            "message": "Edge to placeholder host detected",
+            "context": {"src_host": "host1", "dst_host": "unknown_destination"},
+        },
     )
-    test_db.add(project)
+
+
+def _insert_returning(test_db: Session, model, row: dict):
+    """
+    Insert a single sample row with one INSERT ... RETURNING and return the ORM object.
+
+    RETURNING loads server defaults (ids, timestamps) with the insert itself, so no
+    follow-up refresh SELECT is needed. Values go through ``.values()`` so a row may
+    carry SQL expressions such as a pre-serialized JSON column. The commit releases the
+    fixture's SAVEPOINT so that a rollback inside the code under test cannot discard
+    the fixture row.
+    """
+    obj = test_db.scalars(insert(model).values(row).returning(model)).one()
     test_db.commit()
-    test_db.refresh(project)
-    return project
+    return obj
+
+
+@pytest.fixture(scope="function")
+def sample_project(test_db: Session, _seed_rows: SimpleNamespace) -> Project:
+    """Create and return a Project instance in the database."""
+    return _insert_returning(test_db, Project, _seed_rows.project)
 
 
 @pytest.fixture(scope="function")
 def sample_upload(
-    test_db: Session, sample_project: Project, temp_storage_root: Path
+    test_db: Session,
+    sample_project: Project,
+    temp_storage_root: Path,
+    _archive_cache,
+    _seed_rows: SimpleNamespace,
 ) -> Upload:
     """Create Upload instance with real archive file in temp storage."""
-    # Create real archive using UF config
+    # Link the session-cached UF config archive into this test's storage
     archive_path = create_archive_from_config(
-        create_uf_config, temp_storage_root, upload_id=1, archive_format="zip"
+        _golden_configs().create_uf_config,
+        temp_storage_root,
+        upload_id=1,
+        archive_format="zip",
+        archive_cache=_archive_cache,
     )
 
     # Get file size
     file_size = archive_path.stat().st_size
 
-    upload = Upload(
-        project_id=sample_project.id,
-        filename="test_config.zip",
-        size=file_size,
-        status="completed",
-        storage_uri=str(archive_path),
+    return _insert_returning(
+        test_db,
+        Upload,
+        {
+            "project_id": sample_project.id,
+            "size": file_size,
+            "storage_uri": str(archive_path),
+            **_seed_rows.upload,
+        },
+    )
+
+
+@pytest.fixture(scope="function")
+def sample_upload_norfile(
+    test_db: Session,
+    sample_project: Project,
+    _storage_session_root: Path,
+    _seed_rows: SimpleNamespace,
+) -> Upload:
+    """Create Upload instance whose storage_uri points at an archive that is never written.
+
+    For tests that only check HTTP responses and DB state and never read the archive.
+    """
+    return _insert_returning(
+        test_db,
+        Upload,
+        {
+            "project_id": sample_project.id,
+            "size": 0,
+            "storage_uri": str(_storage_session_root / "stub" / "upload.zip"),
+            **_seed_rows.upload,
+        },
     )
-    test_db.add(upload)
-    test_db.commit()
-    test_db.refresh(upload)
-    return upload
 
 
 @pytest.fixture(scope="function")
-def sample_job(test_db: Session, sample_upload: Upload) -> Job:
+def sample_job(test_db: Session, sample_upload: Upload, _seed_rows: SimpleNamespace) -> Job:
     """Create Job instance linked to sample_upload."""
-    job = Job(
-        upload_id=sample_upload.id,
-        status="completed",
-        log="Job completed successfully",
+    return _insert_returning(test_db, Job, {"upload_id": sample_upload.id, **_seed_rows.job})
+
+
+@pytest.fixture(scope="function")
+def sample_job_norfile(
+    test_db: Session, sample_upload_norfile: Upload, _seed_rows: SimpleNamespace
+) -> Job:
+    """Create Job instance linked to sample_upload_norfile."""
+    return _insert_returning(
+        test_db, Job, {"upload_id": sample_upload_norfile.id, **_seed_rows.job}
     )
-    test_db.add(job)
-    test_db.commit()
-    test_db.refresh(job)
-    return job
 
 
 @pytest.fixture(scope="function")
-def sample_graph(test_db: Session, sample_project: Project, sample_job: Job) -> Graph:
+def sample_graph(
+    test_db: Session, sample_project: Project, sample_job: Job, _seed_rows: SimpleNamespace
+) -> Graph:
     """Create Graph instance with minimal canonical JSON."""
-    graph = Graph(
-        project_id=sample_project.id,
-        job_id=sample_job.id,
-        version="1.0",
-        json_blob={
-            "hosts": [
-                {
-                    "id": "host1",
-                    "roles": ["universal_forwarder"],
-                    "labels": [],
-                    "apps": ["Splunk_TA_nix"],
-                }
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "indexer1",
-                    "protocol": "splunktcp",
-                    "sources": ["/var/log/messages"],
-                    "sourcetypes": ["syslog"],
-                    "indexes": ["main"],
-                    "filters": [],
-                    "drop_rules": [],
-                    "tls": False,
-                    "weight": 1,
-                    "confidence": "explicit",
-                }
-            ],
-            "meta": {
-                "generator": "test",
-                "generated_at": "2025-01-01T00:00:00Z",
-                "host_count": 1,
-                "edge_count": 1,
-                "source_hosts": ["host1"],
-                "traceability": {},
-            },
-        },
-        meta={},
+    return _insert_returning(
+        test_db,
+        Graph,
+        {"project_id": sample_project.id, "job_id": sample_job.id, **_seed_rows.graph},
     )
-    test_db.add(graph)
-    test_db.commit()
-    test_db.refresh(graph)
-    return graph
 
 
 @pytest.fixture(scope="function")
-def sample_finding(test_db: Session, sample_graph: Graph) -> Finding:
+def sample_finding(test_db: Session, sample_graph: Graph, _seed_rows: SimpleNamespace) -> Finding:
     """Create Finding instance linked to sample_graph."""
-    finding = Finding(
-        graph_id=sample_graph.id,
-        code="DANGLING_OUTPUT",
-        severity="error",
-        message="Edge to placeholder host detected",
-        context={"src_host": "host1", "dst_host": "unknown_destination"},
+    return _insert_returning(
+        test_db, Finding, {"graph_id": sample_graph.id, **_seed_rows.finding}
     )
-    test_db.add(finding)
-    test_db.commit()
-    test_db.refresh(finding)
-    return finding
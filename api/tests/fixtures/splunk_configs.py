@@ -1,59 +1,74 @@
-"""Golden Splunk configuration samples for testing parser, resolver, and validator services."""
+"""Golden Splunk configuration samples for testing parser, resolver, and validator services.
 
+Each golden config is a module-level mapping of relative .conf path -> file content,
+pre-encoded as bytes so writes skip per-call string building and encoding. The
+``create_*_config`` functions write that mapping under ``base_dir`` for tests that
+need a config tree on disk; archive helpers stream the mapping straight into an
+archive via ``GOLDEN_CONFIG_FILES`` without touching the filesystem.
+"""
+
+import os
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 
-def write_conf_file(path: Path, content: str) -> None:
+def write_conf_file(path: str | os.PathLike[str], content: str | bytes) -> None:
     """Write .conf file with proper formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+    if isinstance(content, str):
+        content = content.encode()
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def write_conf_tree(base_dir: Path, files: Mapping[str, bytes]) -> Path:
+    """Write a golden config mapping (relative path -> content) under base_dir."""
+    root = os.fspath(base_dir)
+    for rel_path, content in files.items():
+        write_conf_file(os.path.join(root, rel_path), content)
+    return base_dir
 
 
-def create_uf_config(base_dir: Path) -> Path:
-    """
-    Universal Forwarder configuration.
-    Use case: Test basic forwarding, no transforms, simple routing.
-    """
+UF_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (system/local)
-    inputs_content = """[monitor:///var/log/messages]
+    "system/local/inputs.conf": b"""[monitor:///var/log/messages]
 sourcetype = linux:messages
 index = os
 
 [monitor:///var/log/secure]
 sourcetype = linux:secure
 index = security
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (system/local)
-    outputs_content = """[tcpout]
+    "system/local/outputs.conf": b"""[tcpout]
 defaultGroup = hf_group
 
 [tcpout:hf_group]
 server = hf01.example.com:9997
 compressed = true
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
+""",
+}
 
-    return base_dir
 
-
-def create_hf_config(base_dir: Path) -> Path:
+def create_uf_config(base_dir: Path) -> Path:
     """
-    Heavy Forwarder configuration with parsing and routing.
-    Use case: Test props/transforms evaluation, index routing, drops, SSL/TLS.
+    Universal Forwarder configuration.
+    Use case: Test basic forwarding, no transforms, simple routing.
     """
+    return write_conf_tree(base_dir, UF_CONFIG_FILES)
+
+
+HF_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (system/local)
-    inputs_content = """[splunktcp://:9997]
+    "system/local/inputs.conf": b"""[splunktcp://:9997]
 disabled = false
 
 [monitor:///opt/app/logs/*.log]
 sourcetype = app:log
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (system/local)
-    outputs_content = """[tcpout]
+    "system/local/outputs.conf": b"""[tcpout]
 defaultGroup = idx_group
 
 [tcpout:idx_group]
@@ -61,18 +76,14 @@ server = idx01.example.com:9997,idx02.example.com:9997
 useSSL = true
 sslCertPath = /opt/splunk/etc/auth/server.pem
 compressed = true
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
-
+""",
     # props.conf (apps/Splunk_TA_nix/local)
-    props_content = """[sourcetype::app:log]
+    "apps/Splunk_TA_nix/local/props.conf": b"""[sourcetype::app:log]
 TRANSFORMS-route_by_severity = route_by_severity
 TRANSFORMS-drop_debug = drop_debug
-"""
-    write_conf_file(base_dir / "apps/Splunk_TA_nix/local/props.conf", props_content)
-
+""",
     # transforms.conf (apps/Splunk_TA_nix/local)
-    transforms_content = """[route_by_severity]
+    "apps/Splunk_TA_nix/local/transforms.conf": b"""[route_by_severity]
 REGEX = ERROR
 DEST_KEY = _MetaData:Index
 FORMAT = errors
@@ -81,38 +92,40 @@ FORMAT = errors
 REGEX = DEBUG
 DEST_KEY = queue
 FORMAT = nullQueue
-"""
-    write_conf_file(base_dir / "apps/Splunk_TA_nix/local/transforms.conf", transforms_content)
-
-    return base_dir
+""",
+}
 
 
-def create_idx_config(base_dir: Path) -> Path:
+def create_hf_config(base_dir: Path) -> Path:
     """
-    Indexer configuration.
-    Use case: Test indexer role detection, no outputs (terminal node).
+    Heavy Forwarder configuration with parsing and routing.
+    Use case: Test props/transforms evaluation, index routing, drops, SSL/TLS.
     """
+    return write_conf_tree(base_dir, HF_CONFIG_FILES)
+
+
+IDX_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (system/local)
-    inputs_content = """[splunktcp://:9997]
+    "system/local/inputs.conf": b"""[splunktcp://:9997]
 disabled = false
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (empty or minimal)
-    outputs_content = """# Indexer - no forwarding
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
-
-    return base_dir
+    "system/local/outputs.conf": b"""# Indexer - no forwarding
+""",
+}
 
 
-def create_hec_config(base_dir: Path) -> Path:
+def create_idx_config(base_dir: Path) -> Path:
     """
-    HEC (HTTP Event Collector) configuration.
-    Use case: Test HEC input parsing, http_event_collector protocol.
+    Indexer configuration.
+    Use case: Test indexer role detection, no outputs (terminal node).
     """
+    return write_conf_tree(base_dir, IDX_CONFIG_FILES)
+
+
+HEC_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (apps/splunk_httpinput/local)
-    inputs_content = """[http://my_hec_token]
+    "apps/splunk_httpinput/local/inputs.conf": b"""[http://my_hec_token]
 index = hec_index
 sourcetype = _json
 disabled = false
@@ -120,28 +133,28 @@ disabled = false
 [http]
 port = 8088
 disabled = false
-"""
-    write_conf_file(base_dir / "apps/splunk_httpinput/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (system/local)
-    outputs_content = """[tcpout]
+    "system/local/outputs.conf": b"""[tcpout]
 defaultGroup = idx_group
 
 [tcpout:idx_group]
 server = idx01.example.com:9997
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
+""",
+}
 
-    return base_dir
 
-
-def create_indexer_discovery_config(base_dir: Path) -> Path:
+def create_hec_config(base_dir: Path) -> Path:
     """
-    Configuration with indexer discovery.
-    Use case: Test indexer discovery parsing, placeholder host creation.
+    HEC (HTTP Event Collector) configuration.
+    Use case: Test HEC input parsing, http_event_collector protocol.
     """
+    return write_conf_tree(base_dir, HEC_CONFIG_FILES)
+
+
+INDEXER_DISCOVERY_CONFIG_FILES: dict[str, bytes] = {
     # outputs.conf (system/local)
-    outputs_content = """[indexer_discovery:cluster_master]
+    "system/local/outputs.conf": b"""[indexer_discovery:cluster_master]
 master_uri = https://cm.example.com:8089
 pass4SymmKey = <REDACTED>
 
@@ -151,51 +164,50 @@ defaultGroup = discovery_group
 [tcpout:discovery_group]
 indexerDiscovery = cluster_master
 useSSL = true
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
-
+""",
     # inputs.conf (system/local)
-    inputs_content = """[monitor:///var/log/app.log]
+    "system/local/inputs.conf": b"""[monitor:///var/log/app.log]
 sourcetype = app:log
 index = main
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
-    return base_dir
+""",
+}
 
 
-def create_dangling_output_config(base_dir: Path) -> Path:
+def create_indexer_discovery_config(base_dir: Path) -> Path:
     """
-    Configuration with no outputs (dangling).
-    Use case: Test DANGLING_OUTPUT finding detection.
+    Configuration with indexer discovery.
+    Use case: Test indexer discovery parsing, placeholder host creation.
     """
+    return write_conf_tree(base_dir, INDEXER_DISCOVERY_CONFIG_FILES)
+
+
+DANGLING_OUTPUT_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (system/local)
-    inputs_content = """[monitor:///var/log/app.log]
+    "system/local/inputs.conf": b"""[monitor:///var/log/app.log]
 sourcetype = app:log
 index = main
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (empty or missing)
     # Don't create outputs.conf file at all to simulate dangling output
-
-    return base_dir
+}
 
 
-def create_ambiguous_routing_config(base_dir: Path) -> Path:
+def create_dangling_output_config(base_dir: Path) -> Path:
     """
-    Configuration with multiple output groups, no defaultGroup.
-    Use case: Test AMBIGUOUS_GROUP finding detection, confidence=derived.
+    Configuration with no outputs (dangling).
+    Use case: Test DANGLING_OUTPUT finding detection.
     """
+    return write_conf_tree(base_dir, DANGLING_OUTPUT_CONFIG_FILES)
+
+
+AMBIGUOUS_ROUTING_CONFIG_FILES: dict[str, bytes] = {
     # inputs.conf (system/local)
-    inputs_content = """[monitor:///var/log/app.log]
+    "system/local/inputs.conf": b"""[monitor:///var/log/app.log]
 sourcetype = app:log
 index = main
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content)
-
+""",
     # outputs.conf (system/local)
-    outputs_content = """[tcpout]
+    "system/local/outputs.conf": b"""[tcpout]
 # No defaultGroup specified
 
 [tcpout:group1]
@@ -203,43 +215,58 @@ server = idx01.example.com:9997
 
 [tcpout:group2]
 server = idx02.example.com:9997
-"""
-    write_conf_file(base_dir / "system/local/outputs.conf", outputs_content)
-
-    return base_dir
+""",
+}
 
 
-def create_precedence_test_config(base_dir: Path) -> Path:
+def create_ambiguous_routing_config(base_dir: Path) -> Path:
     """
-    Configuration testing precedence rules.
-    Use case: Test precedence resolution (app/local should override all others).
+    Configuration with multiple output groups, no defaultGroup.
+    Use case: Test AMBIGUOUS_GROUP finding detection, confidence=derived.
     """
+    return write_conf_tree(base_dir, AMBIGUOUS_ROUTING_CONFIG_FILES)
+
+
+PRECEDENCE_TEST_CONFIG_FILES: dict[str, bytes] = {
     # system/default
-    inputs_content_sys_default = """[monitor:///var/log/test.log]
+    "system/default/inputs.conf": b"""[monitor:///var/log/test.log]
 sourcetype = test
 index = default_index
-"""
-    write_conf_file(base_dir / "system/default/inputs.conf", inputs_content_sys_default)
-
+""",
     # system/local
-    inputs_content_sys_local = """[monitor:///var/log/test.log]
+    "system/local/inputs.conf": b"""[monitor:///var/log/test.log]
 sourcetype = test
 index = local_index
-"""
-    write_conf_file(base_dir / "system/local/inputs.conf", inputs_content_sys_local)
-
+""",
     # apps/test_app/default
-    inputs_content_app_default = """[monitor:///var/log/test.log]
+    "apps/test_app/default/inputs.conf": b"""[monitor:///var/log/test.log]
 sourcetype = test
 index = app_default_index
-"""
-    write_conf_file(base_dir / "apps/test_app/default/inputs.conf", inputs_content_app_default)
-
+""",
     # apps/test_app/local (should win)
-    inputs_content_app_local = """[monitor:///var/log/test.log]
+    "apps/test_app/local/inputs.conf": b"""[monitor:///var/log/test.log]
 sourcetype = test
 index = app_local_index
-"""
-    write_conf_file(base_dir / "apps/test_app/local/inputs.conf", inputs_content_app_local)
+""",
+}
 
-    return base_dir
+
+def create_precedence_test_config(base_dir: Path) -> Path:
+    """
+    Configuration testing precedence rules.
+    Use case: Test precedence resolution (app/local should override all others).
+    """
+    return write_conf_tree(base_dir, PRECEDENCE_TEST_CONFIG_FILES)
+
+
+# Golden config creator -> file mapping, for helpers that build archives in memory
+GOLDEN_CONFIG_FILES: dict[Callable[[Path], Path], dict[str, bytes]] = {
+    create_uf_config: UF_CONFIG_FILES,
+    create_hf_config: HF_CONFIG_FILES,
+    create_idx_config: IDX_CONFIG_FILES,
+    create_hec_config: HEC_CONFIG_FILES,
+    create_indexer_discovery_config: INDEXER_DISCOVERY_CONFIG_FILES,
+    create_dangling_output_config: DANGLING_OUTPUT_CONFIG_FILES,
+    create_ambiguous_routing_config: AMBIGUOUS_ROUTING_CONFIG_FILES,
+    create_precedence_test_config: PRECEDENCE_TEST_CONFIG_FILES,
+}
@@ -0,0 +1,24 @@
+"""Integration tests for the 404 contract shared by id-addressed endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "method,url",
+    [
+        ("get", "/api/v1/projects/99999"),
+        ("patch", "/api/v1/projects/99999"),
+        ("delete", "/api/v1/projects/99999"),
+        ("get", "/api/v1/uploads/99999"),
+        ("post", "/api/v1/uploads/99999/jobs"),
+        ("get", "/api/v1/jobs/99999"),
+    ],
+)
+async def test_not_found(client: AsyncClient, method: str, url: str):
+    """Verify 404 for non-existent project, upload and job IDs."""
+    # PATCH validates its body before the lookup, so send a valid update
+    json = {"name": "Renamed"} if method == "patch" else None
+    response = await client.request(method, url, json=json)
+    assert response.status_code == 404
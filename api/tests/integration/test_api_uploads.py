@@ -5,66 +5,58 @@ import zipfile
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.main import app
 from app.models.project import Project
 from app.models.upload import Upload
-from tests.fixtures.splunk_configs import create_hf_config, create_uf_config
+from app.services import storage
 
 
-@pytest.fixture
-def client(test_db: Session):
-    """Create TestClient with test database."""
+@pytest.fixture(scope="session")
+def sample_zip_bytes() -> bytes:
+    """Minimal valid ZIP archive, built once per session.
 
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass  # Let test_db fixture handle cleanup
-
-    app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
-    app.dependency_overrides.clear()
-
-
-def create_test_zip_archive(tmp_path: Path, name: str = "test.zip") -> io.BytesIO:
-    """Create a minimal valid ZIP archive in memory for testing."""
+    Entries are stored uncompressed: the tests only check structure, not size.
+    httpx accepts bytes for multipart files, so pass it directly as
+    ``files={"file": ("test.zip", sample_zip_bytes, "application/zip")}``.
+    """
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zf:
         zf.writestr("etc/system/local/inputs.conf", "[monitor:///var/log]\nindex = main\n")
         zf.writestr("etc/system/local/outputs.conf", "[tcpout]\nserver = idx1:9997\n")
-    zip_buffer.seek(0)
-    return zip_buffer
+    return zip_buffer.getvalue()
 
 
 @pytest.mark.integration
 class TestCreateUpload:
     """Test POST /api/v1/projects/{project_id}/uploads endpoint."""
 
-    def test_create_upload_success(
-        self, client: TestClient, test_db: Session, sample_project: Project, tmp_path: Path
+    async def test_create_upload_success(
+        self,
+        client: AsyncClient,
+        test_db: Session,
+        sample_project: Project,
+        sample_zip_bytes: bytes,
     ):
         """Upload valid ZIP file, verify 201 response and Upload record created."""
-        # TODO: Create test ZIP archive
-        # TODO: POST /api/v1/projects/{project_id}/uploads with multipart file
+        # TODO: POST /api/v1/projects/{project_id}/uploads with sample_zip_bytes as the file
         # TODO: Assert status 201
         # TODO: Verify response contains upload_id, filename, size, status
         # TODO: Verify Upload record exists in database
         # TODO: Verify artifact file saved to storage
         pass
 
-    def test_create_upload_project_not_found(self, client: TestClient, tmp_path: Path):
+    async def test_create_upload_project_not_found(
+        self, client: AsyncClient, sample_zip_bytes: bytes
+    ):
         """Return 404 when project_id doesn't exist."""
-        # TODO: Create test ZIP archive
-        # TODO: POST /api/v1/projects/99999/uploads
+        # TODO: POST /api/v1/projects/99999/uploads with sample_zip_bytes as the file
         # TODO: Assert status 404
         pass
 
-    def test_create_upload_invalid_file_type(
-        self, client: TestClient, sample_project: Project
+    async def test_create_upload_invalid_file_type(
+        self, client: AsyncClient, sample_project: Project
     ):
         """Reject non-ZIP/tar.gz file with 400 error."""
         # TODO: Create text file or invalid archive
@@ -73,8 +65,8 @@ class TestCreateUpload:
         # TODO: Verify error message mentions invalid file type
         pass
 
-    def test_create_upload_file_too_large(
-        self, client: TestClient, sample_project: Project
+    async def test_create_upload_file_too_large(
+        self, client: AsyncClient, sample_project: Project
     ):
         """Reject file exceeding size limit with 413 error."""
         # TODO: Create large file exceeding MAX_UPLOAD_SIZE
@@ -82,7 +74,7 @@ class TestCreateUpload:
         # TODO: Assert status 413
         pass
 
-    def test_create_upload_missing_file(self, client: TestClient, sample_project: Project):
+    async def test_create_upload_missing_file(self, client: AsyncClient, sample_project: Project):
         """Return 422 when file field is missing."""
         # TODO: POST /api/v1/projects/{project_id}/uploads without file
         # TODO: Assert status 422 (validation error)
@@ -93,26 +85,20 @@ class TestCreateUpload:
 class TestGetUpload:
     """Test GET /api/v1/uploads/{upload_id} endpoint."""
 
-    def test_get_upload_success(self, client: TestClient, sample_upload: Upload):
+    async def test_get_upload_success(self, client: AsyncClient, sample_upload: Upload):
         """Get existing upload, verify 200 response."""
         # TODO: GET /api/v1/uploads/{upload_id}
         # TODO: Assert status 200
         # TODO: Verify response contains id, project_id, filename, size, status, storage_uri
         pass
 
-    def test_get_upload_not_found(self, client: TestClient):
-        """Verify 404 for non-existent upload ID."""
-        # TODO: GET /api/v1/uploads/99999
-        # TODO: Assert status 404
-        pass
-
 
 @pytest.mark.integration
 class TestListUploads:
     """Test GET /api/v1/projects/{project_id}/uploads endpoint."""
 
-    def test_list_uploads_for_project(
-        self, client: TestClient, sample_project: Project, sample_upload: Upload
+    async def test_list_uploads_for_project(
+        self, client: AsyncClient, sample_project: Project, sample_upload: Upload
     ):
         """List all uploads for a project."""
         # TODO: GET /api/v1/projects/{project_id}/uploads
@@ -120,15 +106,15 @@ class TestListUploads:
         # TODO: Verify response is array containing sample_upload
         pass
 
-    def test_list_uploads_empty(self, client: TestClient, sample_project: Project):
+    async def test_list_uploads_empty(self, client: AsyncClient, sample_project: Project):
         """Verify empty array when project has no uploads."""
         # TODO: GET /api/v1/projects/{project_id}/uploads
         # TODO: Assert status 200
         # TODO: Assert response is empty array
         pass
 
-    def test_list_uploads_filter_by_status(
-        self, client: TestClient, test_db: Session, sample_project: Project
+    async def test_list_uploads_filter_by_status(
+        self, client: AsyncClient, test_db: Session, sample_project: Project
     ):
         """Filter uploads by status parameter."""
         # TODO: Create uploads with different statuses (uploaded, processing, completed, failed)
@@ -141,8 +127,8 @@ class TestListUploads:
 class TestDeleteUpload:
     """Test DELETE /api/v1/uploads/{upload_id} endpoint."""
 
-    def test_delete_upload_success(
-        self, client: TestClient, test_db: Session, sample_upload: Upload, temp_storage_root: Path
+    async def test_delete_upload_success(
+        self, client: AsyncClient, test_db: Session, sample_upload: Upload, temp_storage_root: Path
     ):
         """Delete upload, verify 204 response and cascade deletion."""
         # TODO: Verify artifact file exists in storage
@@ -152,14 +138,14 @@ class TestDeleteUpload:
         # TODO: Verify artifact file deleted from storage
         pass
 
-    def test_delete_upload_not_found(self, client: TestClient):
+    async def test_delete_upload_not_found(self, client: AsyncClient):
         """Verify 404 for non-existent upload ID."""
         # TODO: DELETE /api/v1/uploads/99999
         # TODO: Assert status 404
         pass
 
-    def test_delete_upload_cascade_jobs(
-        self, client: TestClient, test_db: Session, sample_upload: Upload
+    async def test_delete_upload_cascade_jobs(
+        self, client: AsyncClient, test_db: Session, sample_upload: Upload
     ):
         """Verify deleting upload also deletes associated jobs."""
         # TODO: Create job associated with sample_upload
@@ -173,39 +159,79 @@ class TestDeleteUpload:
 class TestUploadFileHandling:
     """Test archive extraction and file validation."""
 
-    def test_upload_zip_extraction(
-        self, client: TestClient, test_db: Session, sample_project: Project, tmp_path: Path
+    async def test_upload_zip_extraction(
+        self,
+        client: AsyncClient,
+        sample_project: Project,
+        temp_storage_root: Path,
+        uf_zip_archive: Path,
     ):
         """Upload ZIP file, verify extraction to work directory."""
-        # TODO: Create ZIP with golden config (create_uf_config)
-        # TODO: POST /api/v1/projects/{project_id}/uploads
-        # TODO: Verify upload created
-        # TODO: Verify archive extracted to storage_root/artifacts/{upload_id}/
-        # TODO: Verify extracted files readable
-        pass
-
-    def test_upload_tar_gz_extraction(
-        self, client: TestClient, test_db: Session, sample_project: Project, tmp_path: Path
+        archive_bytes = uf_zip_archive.read_bytes()
+
+        response = await client.post(
+            f"/api/v1/projects/{sample_project.id}/uploads",
+            files={"file": ("uf_config.zip", archive_bytes, "application/zip")},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["size"] == len(archive_bytes)
+        stored = Path(data["storage_uri"])
+        assert stored.read_bytes() == archive_bytes
+
+        extracted = storage.extract_archive_safe(stored, temp_storage_root / "work")
+        assert any(path.name == "inputs.conf" for path in extracted)
+        assert all(path.read_bytes() for path in extracted if path.is_file())
+
+    async def test_upload_tar_gz_extraction(
+        self,
+        client: AsyncClient,
+        sample_project: Project,
+        temp_storage_root: Path,
+        hf_targz_archive: Path,
     ):
         """Upload tar.gz file, verify extraction."""
-        # TODO: Create tar.gz with golden config
-        # TODO: POST /api/v1/projects/{project_id}/uploads
-        # TODO: Verify upload created
-        # TODO: Verify archive extracted correctly
-        pass
+        archive_bytes = hf_targz_archive.read_bytes()
+
+        response = await client.post(
+            f"/api/v1/projects/{sample_project.id}/uploads",
+            files={"file": ("hf_config.tar.gz", archive_bytes, "application/gzip")},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["storage_uri"].endswith("upload.tar.gz")
 
-    def test_upload_path_traversal_prevention(
-        self, client: TestClient, sample_project: Project, tmp_path: Path
+        extracted = storage.extract_archive_safe(
+            Path(data["storage_uri"]), temp_storage_root / "work"
+        )
+        assert {"outputs.conf", "props.conf"} <= {path.name for path in extracted}
+
+    async def test_upload_path_traversal_prevention(
+        self, client: AsyncClient, sample_project: Project, temp_storage_root: Path
     ):
         """Reject archive with path traversal attempts."""
-        # TODO: Create malicious ZIP with ../../../etc/passwd entry
-        # TODO: POST /api/v1/projects/{project_id}/uploads
-        # TODO: Assert status 400
-        # TODO: Verify error message mentions security issue
-        pass
-
-    def test_upload_archive_bomb_prevention(
-        self, client: TestClient, sample_project: Project
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("../../../etc/passwd", "root:x:0:0:root:/root:/bin/bash\n")
+
+        response = await client.post(
+            f"/api/v1/projects/{sample_project.id}/uploads",
+            files={"file": ("evil.zip", zip_buffer.getvalue(), "application/zip")},
+        )
+
+        # The upload itself is stored as-is; the traversal is refused at extraction
+        assert response.status_code == 201
+        work_dir = temp_storage_root / "work"
+        with pytest.raises(ValueError, match="Path traversal attempt"):
+            storage.extract_archive_safe(Path(response.json()["storage_uri"]), work_dir)
+        assert not any(work_dir.rglob("passwd"))
+
+    async def test_upload_archive_bomb_prevention(
+        self, client: AsyncClient, sample_project: Project
     ):
         """Reject archive with excessive compression ratio (zip bomb)."""
         # TODO: Create ZIP with high compression ratio
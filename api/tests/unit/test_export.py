@@ -1,47 +1,136 @@
 """Unit tests for the export service."""
 
-import json
+import copy
+import io
+import subprocess
+import threading
+import zipfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import orjson
 import pytest
 
 from app.services.export import (
     MAX_DISPLAYED_INDEXES,
     NODE_COLORS,
+    _dot_output_formats,
+    _link_file,
+    _weight_to_penwidth,
+    apply_graph_filters,
     build_dot_from_canonical_graph,
+    create_export_archive,
     export_as_image,
+    export_as_images,
     export_as_json,
+    export_as_json_bytes,
     export_graph,
+    iter_dot_lines,
     validate_export_format,
+    write_json_stream,
 )
+from app.services.resolver import GENERATOR
+
+
+@pytest.fixture(autouse=True)
+def dot_output_formats():
+    """Stub the Graphviz capability probe so mocked renders don't hit the real dot."""
+    with patch(
+        "app.services.export._dot_output_formats", return_value=frozenset({"png", "pdf"})
+    ) as probe:
+        yield probe
+
+
+def fake_dot_run(cmd, **kwargs):
+    """Stand-in for subprocess.run invoking dot with DOT source on stdin."""
+    assert kwargs["input"].startswith(b"digraph G {")
+    if "-o" not in cmd:
+        # Rendered output written to stdout
+        return subprocess.CompletedProcess(cmd, 0, stdout=f"rendered {cmd[1][2:]}".encode())
+    # "-T<format> -o <path>" pairs write each format to its path
+    for i, arg in enumerate(cmd):
+        if arg == "-o":
+            Path(cmd[i + 1]).write_bytes(f"rendered {cmd[i - 1][2:]}".encode())
+    return subprocess.CompletedProcess(cmd, 0, stdout=b"")
+
+
+# Shared across the session; tests must not mutate these (copy.deepcopy first if needed)
+@pytest.fixture(scope="session")
+def canonical_graph() -> dict:
+    """Canonical graph with one UF forwarding to one indexer."""
+    return {
+        "hosts": [
+            {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
+            {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
+        ],
+        "edges": [
+            {
+                "src_host": "host1",
+                "dst_host": "host2",
+                "protocol": "splunktcp",
+                "indexes": ["main"],
+                "tls": False,
+                "weight": 1,
+            }
+        ],
+        "meta": {},
+    }
+
+
+@pytest.fixture(scope="session")
+def single_host_graph() -> dict:
+    """Canonical graph with a single UF and no edges."""
+    return {
+        "hosts": [
+            {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
+        ],
+        "edges": [],
+        "meta": {},
+    }
+
+
+@pytest.fixture(scope="session")
+def forwarding_chain_graph() -> dict:
+    """Forwarding chain uf01 -> hf01 -> idx01/idx02."""
+    return {
+        "hosts": [
+            {"id": "uf01", "roles": ["universal_forwarder"], "labels": [], "apps": []},
+            {"id": "hf01", "roles": ["heavy_forwarder"], "labels": [], "apps": []},
+            {"id": "idx01", "roles": ["indexer"], "labels": [], "apps": []},
+            {"id": "idx02", "roles": ["indexer"], "labels": [], "apps": []},
+        ],
+        "edges": [
+            {
+                "src_host": "uf01",
+                "dst_host": "hf01",
+                "protocol": "splunktcp",
+                "indexes": ["main", "security"],
+            },
+            {
+                "src_host": "hf01",
+                "dst_host": "idx01",
+                "protocol": "splunktcp",
+                "indexes": ["main"],
+            },
+            {
+                "src_host": "hf01",
+                "dst_host": "idx02",
+                "protocol": "http_event_collector",
+                "indexes": ["security"],
+            },
+        ],
+        "meta": {"host_count": 4, "edge_count": 3},
+    }
 
 
 @pytest.mark.unit
 class TestDOTGeneration:
     """Test DOT (Graphviz) format generation."""
 
-    def test_generate_dot_simple(self, tmp_path: Path):
+    def test_generate_dot_simple(self, canonical_graph: dict, tmp_path: Path):
         """Generate DOT from simple graph."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "host2",
-                    "protocol": "splunktcp",
-                    "indexes": ["main"],
-                    "tls": False,
-                    "weight": 1,
-                }
-            ],
-            "meta": {},
-        }
-
-        dot_str = build_dot_from_canonical_graph(graph_json)
+        dot_str = build_dot_from_canonical_graph(canonical_graph)
 
         assert "digraph G {" in dot_str
         assert '"host1"' in dot_str
@@ -176,6 +265,25 @@ class TestDOTGeneration:
         # Should have placeholder indicator or gray color
         assert NODE_COLORS.get("unknown", "#CCCCCC") in dot_str or "(placeholder)" in dot_str
 
+    def test_generate_dot_placeholder_label(self, tmp_path: Path):
+        """Verify resolver placeholders (labelled, no is_placeholder flag) are styled."""
+        graph_json = {
+            "hosts": [
+                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
+                {"id": "idx_unknown", "roles": ["indexer"], "labels": ["placeholder"], "apps": []},
+            ],
+            "edges": [],
+            "meta": {},
+        }
+
+        dot_lines = build_dot_from_canonical_graph(graph_json).splitlines()
+
+        placeholder_line = next(line for line in dot_lines if '"idx_unknown" [' in line)
+        assert "(placeholder)" in placeholder_line
+        assert "filled,dashed" in placeholder_line
+        host_line = next(line for line in dot_lines if '"host1" [' in line)
+        assert "dashed" not in host_line
+
     def test_generate_dot_empty_graph(self, tmp_path: Path):
         """Generate DOT from empty graph."""
         graph_json: dict[str, object] = {
@@ -190,6 +298,30 @@ class TestDOTGeneration:
         assert dot_str is not None
         assert len(dot_str) > 0
         assert "digraph G {" in dot_str
+        # The early return matches the streamed form
+        assert dot_str == "".join(iter_dot_lines(graph_json))
+
+    def test_generate_dot_skip_isolated_hosts(self, forwarding_chain_graph: dict):
+        """Verify compact mode drops hosts no edge references."""
+        graph_json = copy.deepcopy(forwarding_chain_graph)
+        graph_json["hosts"].append(
+            {"id": "lonely01", "roles": ["search_head"], "labels": [], "apps": []}
+        )
+
+        assert '"lonely01" [' in build_dot_from_canonical_graph(graph_json)
+        compact = build_dot_from_canonical_graph(graph_json, render_isolated=False)
+        assert "lonely01" not in compact
+        assert compact == build_dot_from_canonical_graph(forwarding_chain_graph)
+
+    def test_iter_dot_lines(self, forwarding_chain_graph: dict):
+        """Verify streamed DOT lines join to the built DOT string."""
+        lines = list(iter_dot_lines(forwarding_chain_graph))
+
+        assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+        assert "".join(lines) == build_dot_from_canonical_graph(forwarding_chain_graph)
+        assert "".join(iter_dot_lines({"hosts": [], "edges": []})) == (
+            build_dot_from_canonical_graph({"hosts": [], "edges": []})
+        )
 
     def test_generate_dot_edge_weight(self, tmp_path: Path):
         """Verify edge weight affects penwidth."""
@@ -222,25 +354,38 @@ class TestDOTGeneration:
 
         dot_str = build_dot_from_canonical_graph(graph_json)
 
-        # Extract penwidth values for each edge
-        import re
-
-        # Find edge to host2 (weight=1)
-        host2_match = re.search(r'"host1" -> "host2".*?penwidth=([\d.]+)', dot_str)
-        assert host2_match is not None, "host2 edge not found"
-        penwidth_weight1 = float(host2_match.group(1))
-
-        # Find edge to host3 (weight=10)
-        host3_match = re.search(r'"host1" -> "host3".*?penwidth=([\d.]+)', dot_str)
-        assert host3_match is not None, "host3 edge not found"
-        penwidth_weight10 = float(host3_match.group(1))
-
+        # Each edge is emitted with the penwidth for its weight
+        assert f"penwidth={_weight_to_penwidth(1)}]" in dot_str
+        assert f"penwidth={_weight_to_penwidth(10)}]" in dot_str
         # Higher weight should have larger penwidth
-        assert penwidth_weight10 > penwidth_weight1
+        assert _weight_to_penwidth(10) > _weight_to_penwidth(1)
         # Both edges should be present
         assert "host2" in dot_str
         assert "host3" in dot_str
 
+    def test_generate_dot_escapes_host_ids(self):
+        """Verify quotes and backslashes in host IDs are escaped in nodes and edges."""
+        graph_json = {
+            "hosts": [
+                {"id": 'uf "01"', "roles": ["universal_forwarder"], "labels": [], "apps": []},
+                {"id": "DOMAIN\\idx01", "roles": ["indexer"], "labels": [], "apps": []},
+            ],
+            "edges": [
+                {
+                    "src_host": 'uf "01"',
+                    "dst_host": "DOMAIN\\idx01",
+                    "protocol": "splunktcp",
+                    "indexes": ["main"],
+                }
+            ],
+            "meta": {},
+        }
+
+        dot_str = build_dot_from_canonical_graph(graph_json)
+
+        assert '"uf \\"01\\"" [label="uf \\"01\\"\\nUF"' in dot_str
+        assert '"uf \\"01\\"" -> "DOMAIN\\\\idx01"' in dot_str
+
     def test_generate_dot_many_indexes(self, tmp_path: Path):
         """Verify many indexes are truncated in labels."""
         graph_json = {
@@ -292,7 +437,7 @@ class TestDOTGeneration:
 class TestJSONGeneration:
     """Test JSON export format."""
 
-    def test_generate_json_complete(self, tmp_path: Path):
+    def test_generate_json_complete(self):
         """Generate JSON with all graph fields."""
         graph_json = {
             "hosts": [
@@ -315,7 +460,7 @@ class TestJSONGeneration:
         json_str = export_as_json(graph_json)
 
         # Verify valid JSON
-        parsed = json.loads(json_str)
+        parsed = orjson.loads(json_str)
         assert "hosts" in parsed
         assert "edges" in parsed
         assert "meta" in parsed
@@ -323,17 +468,9 @@ class TestJSONGeneration:
         assert parsed["edges"] == graph_json["edges"]
         assert parsed["meta"] == graph_json["meta"]
 
-    def test_generate_json_pretty_print(self, tmp_path: Path):
+    def test_generate_json_pretty_print(self, single_host_graph: dict, tmp_path: Path):
         """Verify JSON is human-readable (indented)."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
-        json_str = export_as_json(graph_json)
+        json_str = export_as_json(single_host_graph)
 
         # Pretty-printed JSON should contain newlines and indentation
         assert "\n" in json_str
@@ -341,40 +478,49 @@ class TestJSONGeneration:
         # Line count should be > 10 for typical graph
         assert len(json_str.split("\n")) > 5
 
-    @pytest.mark.skip(reason="export_as_json does not support minification parameter")
-    def test_generate_json_minified(self, tmp_path: Path):
+    def test_generate_json_minified(self, single_host_graph: dict, tmp_path: Path):
         """Verify JSON can be minified for size."""
-        # NOTE: export_as_json does not support minification parameter
-        # This test is skipped as minification is not implemented
-        pass
+        json_str = export_as_json(single_host_graph, pretty=False)
 
-    def test_generate_json_serialization(self, tmp_path: Path):
-        """Verify JSON can be deserialized back."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "host2",
-                    "protocol": "splunktcp",
-                    "indexes": ["main"],
-                    "tls": False,
-                    "weight": 1,
-                }
-            ],
-            "meta": {},
-        }
+        assert "\n" not in json_str
+        assert len(json_str) < len(export_as_json(single_host_graph))
+        assert orjson.loads(json_str) == single_host_graph
 
-        json_str = export_as_json(graph_json)
-        parsed = json.loads(json_str)
+    def test_generate_json_serialization(self, canonical_graph: dict, tmp_path: Path):
+        """Verify JSON can be deserialized back."""
+        json_str = export_as_json(canonical_graph)
+        parsed = orjson.loads(json_str)
 
         # Round-trip serialization should preserve data
-        assert parsed["hosts"] == graph_json["hosts"]
-        assert parsed["edges"] == graph_json["edges"]
-        assert parsed["meta"] == graph_json["meta"]
+        assert parsed["hosts"] == canonical_graph["hosts"]
+        assert parsed["edges"] == canonical_graph["edges"]
+        assert parsed["meta"] == canonical_graph["meta"]
+
+        # Byte variant yields the same document without a decode
+        json_bytes = export_as_json_bytes(canonical_graph)
+        assert isinstance(json_bytes, bytes)
+        assert json_bytes == json_str.encode()
+        assert orjson.loads(json_bytes) == parsed
+
+    def test_generate_json_empty_graph(self):
+        """Verify the empty-graph fast path matches a regular serialization."""
+        empty = {"hosts": [], "edges": [], "meta": {}}
+
+        for pretty in (True, False):
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            assert export_as_json_bytes(empty, pretty=pretty) == orjson.dumps(empty, option=option)
+        # Other key orders bypass the fast path and keep their order
+        reordered = {"meta": {}, "edges": [], "hosts": []}
+        assert export_as_json_bytes(reordered) == orjson.dumps(
+            reordered, option=orjson.OPT_INDENT_2
+        )
+
+    def test_generate_json_stream(self, canonical_graph: dict, forwarding_chain_graph: dict):
+        """Verify streamed JSON is byte-identical to the one-shot export."""
+        for graph_json in (canonical_graph, forwarding_chain_graph, {}):
+            buffer = io.BytesIO()
+            write_json_stream(graph_json, buffer)
+            assert buffer.getvalue() == export_as_json_bytes(graph_json)
 
 
 @pytest.mark.unit
@@ -382,27 +528,11 @@ class TestJSONGeneration:
 class TestPNGGeneration:
     """Test PNG image generation (requires Graphviz)."""
 
-    def test_generate_png_from_dot(self, tmp_path: Path, temp_storage_root: Path):
+    def test_generate_png_from_dot(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Generate PNG image from DOT source."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "host2",
-                    "protocol": "splunktcp",
-                    "indexes": ["main"],
-                    "tls": False,
-                    "weight": 1,
-                }
-            ],
-            "meta": {},
-        }
-
-        png_path = export_as_image(graph_json, "png", graph_id=1)
+        png_path = export_as_image(canonical_graph, "png", graph_id=1)
 
         # Verify PNG file exists
         assert png_path.exists()
@@ -412,56 +542,133 @@ class TestPNGGeneration:
             magic = f.read(8)
             assert magic == b"\x89PNG\r\n\x1a\n"
 
-    @pytest.mark.skip(reason="export_as_image does not support DPI configuration")
-    def test_generate_png_resolution(self, tmp_path: Path):
+    def test_generate_png_resolution(self, single_host_graph: dict, temp_storage_root: Path):
         """Verify PNG resolution can be configured (dpi)."""
-        # NOTE: export_as_image does not support DPI parameter
-        # DPI is controlled by Graphviz defaults
-        pass
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run:
+            png_path = export_as_image(single_host_graph, "png", graph_id=1, dpi=300)
 
-    def test_generate_png_graphviz_not_installed(self, tmp_path: Path):
-        """Handle missing Graphviz gracefully."""
-        from graphviz import ExecutableNotFound  # type: ignore[import-untyped]
+        cmd = mock_run.call_args.args[0]
+        assert "-Gdpi=300" in cmd
+        # dot writes the file itself; nothing is returned through stdout
+        assert cmd[cmd.index("-o") + 1] == str(png_path)
+        assert png_path.read_bytes() == b"rendered png"
 
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
+        with pytest.raises(ValueError, match="Invalid dpi"):
+            export_as_image(single_host_graph, "png", graph_id=1, dpi=0)
 
-        with patch("app.services.export.graphviz.Source.render") as mock_render:
-            mock_render.side_effect = ExecutableNotFound("dot")
+    def test_generate_png_graphviz_not_installed(self, single_host_graph: dict, tmp_path: Path):
+        """Handle missing Graphviz gracefully."""
+        with patch("app.services.export.subprocess.run") as mock_run:
+            mock_run.side_effect = FileNotFoundError("dot")
             with pytest.raises(RuntimeError) as exc_info:
-                export_as_image(graph_json, "png", graph_id=1)
+                export_as_image(single_host_graph, "png", graph_id=1)
             assert "Graphviz is not installed" in str(exc_info.value)
 
-    def test_generate_png_invalid_format(self, tmp_path: Path):
+    def test_generate_images_single_dot_invocation(
+        self, single_host_graph: dict, temp_storage_root: Path
+    ):
+        """Verify PNG and PDF are rendered by one dot process."""
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run:
+            paths = export_as_images(single_host_graph, ["png", "pdf"], graph_id=1)
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args.args[0]
+        assert "-Tpng" in cmd
+        assert "-Tpdf" in cmd
+        assert paths["png"].name == "graph_1.png"
+        assert paths["pdf"].name == "graph_1.pdf"
+        assert paths["png"].read_bytes() == b"rendered png"
+        # DOT source is piped on stdin; only the rendered files are written
+        assert sorted(p.name for p in paths["png"].parent.iterdir()) == [
+            "graph_1.pdf",
+            "graph_1.png",
+        ]
+
+    def test_generate_png_reuses_dot_source(self, canonical_graph: dict, temp_storage_root: Path):
+        """Verify a caller-supplied DOT string is rendered without rebuilding it."""
+        dot_source = build_dot_from_canonical_graph(canonical_graph)
+
+        with (
+            patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run,
+            patch("app.services.export.build_dot_from_canonical_graph") as builder,
+        ):
+            export_as_image(canonical_graph, "png", graph_id=1, dot_source=dot_source)
+
+        builder.assert_not_called()
+        assert mock_run.call_args.kwargs["input"] == dot_source.encode()
+
+    def test_generate_png_render_cache(self, single_host_graph: dict, temp_storage_root: Path):
+        """Verify repeat exports of the same graph reuse the cached render."""
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run:
+            first = export_as_image(single_host_graph, "png", graph_id=1)
+            # Router deletes the returned file after streaming it
+            first.unlink()
+            second = export_as_image(single_host_graph, "png", graph_id=2)
+            assert mock_run.call_count == 1
+
+            # Only the missing format is rendered
+            export_as_images(single_host_graph, ["png", "pdf"], graph_id=3)
+            assert mock_run.call_count == 2
+            assert "-Tpng" not in mock_run.call_args.args[0]
+
+            # A different resolution is a different render
+            export_as_image(single_host_graph, "png", graph_id=4, dpi=300)
+            assert mock_run.call_count == 3
+
+        assert second.name == "graph_2.png"
+        assert second.read_bytes() == b"rendered png"
+
+    def test_generate_png_render_cache_eviction(
+        self, canonical_graph: dict, single_host_graph: dict, temp_storage_root: Path
+    ):
+        """Verify the render cache keeps only the most recent RENDER_CACHE_SIZE files."""
+        with (
+            patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run,
+            patch("app.services.export.RENDER_CACHE_SIZE", 1),
+        ):
+            export_as_image(single_host_graph, "png", graph_id=1)
+            export_as_image(canonical_graph, "png", graph_id=1)
+            export_as_image(single_host_graph, "png", graph_id=1)
+
+        assert mock_run.call_count == 3
+        assert len(list((temp_storage_root / "exports" / ".render_cache").iterdir())) == 1
+
+    def test_render_cache_concurrent_links(self, tmp_path: Path):
+        """Verify concurrent links to one destination each use their own temp file."""
+        src = tmp_path / "render.png"
+        src.write_bytes(b"\x89PNG")
+        dst = tmp_path / "graph_1.png"
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def link():
+            barrier.wait()
+            try:
+                _link_file(src, dst)
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=link) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert dst.read_bytes() == b"\x89PNG"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["graph_1.png", "render.png"]
+
+    def test_generate_png_invalid_format(self, single_host_graph: dict, tmp_path: Path):
         """Verify invalid image format raises error."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
         with pytest.raises(ValueError) as exc_info:
-            export_as_image(graph_json, "invalid", graph_id=1)
+            export_as_image(single_host_graph, "invalid", graph_id=1)
         assert "Invalid image format" in str(exc_info.value)
 
-    def test_generate_png_cleanup(self, tmp_path: Path, temp_storage_root: Path):
+    def test_generate_png_cleanup(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Verify PNG file cleanup works correctly."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
-        png_path = export_as_image(graph_json, "png", graph_id=1)
+        png_path = export_as_image(single_host_graph, "png", graph_id=1)
         assert png_path.exists()
 
         # Manually delete the file (simulating cleanup)
@@ -474,27 +681,11 @@ class TestPNGGeneration:
 class TestPDFGeneration:
     """Test PDF document generation (requires Graphviz)."""
 
-    def test_generate_pdf_from_dot(self, tmp_path: Path, temp_storage_root: Path):
+    def test_generate_pdf_from_dot(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Generate PDF document from DOT source."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "host2",
-                    "protocol": "splunktcp",
-                    "indexes": ["main"],
-                    "tls": False,
-                    "weight": 1,
-                }
-            ],
-            "meta": {},
-        }
-
-        pdf_path = export_as_image(graph_json, "pdf", graph_id=1)
+        pdf_path = export_as_image(canonical_graph, "pdf", graph_id=1)
 
         # Verify PDF file exists
         assert pdf_path.exists()
@@ -506,33 +697,46 @@ class TestPDFGeneration:
         # Verify file extension
         assert pdf_path.suffix == ".pdf"
 
-    def test_generate_pdf_vector_format(self, tmp_path: Path, temp_storage_root: Path):
+    def test_generate_pdf_vector_format(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Verify PDF is vector format (scalable)."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
-            ],
-            "edges": [
-                {
-                    "src_host": "host1",
-                    "dst_host": "host2",
-                    "protocol": "splunktcp",
-                    "indexes": ["main"],
-                    "tls": False,
-                    "weight": 1,
-                }
-            ],
-            "meta": {},
-        }
-
-        pdf_path = export_as_image(graph_json, "pdf", graph_id=1)
+        pdf_path = export_as_image(canonical_graph, "pdf", graph_id=1)
 
         # PDF should be reasonable size (< 1MB for typical graph)
         assert pdf_path.stat().st_size < 1024 * 1024
         # PDF is vector format (implicit in Graphviz PDF output)
         assert pdf_path.exists()
 
+    def test_generate_pdf_capability_cached(self):
+        """Verify the dot output-format probe runs once and is reused."""
+        probe_output = subprocess.CompletedProcess(
+            ["dot", "-T?"],
+            1,
+            stdout=b"",
+            stderr=b'Format: "?" not recognized. Use one of: dot pdf png svg\n',
+        )
+        _dot_output_formats.cache_clear()
+        try:
+            with patch("app.services.export.subprocess.run", return_value=probe_output) as mock_run:
+                for _ in range(3):
+                    assert _dot_output_formats() == {"dot", "pdf", "png", "svg"}
+            assert mock_run.call_count == 1
+            assert mock_run.call_args.args[0] == ["dot", "-T?"]
+        finally:
+            _dot_output_formats.cache_clear()
+
+    def test_generate_pdf_unsupported_by_graphviz(
+        self, single_host_graph: dict, dot_output_formats, temp_storage_root: Path
+    ):
+        """Fail clearly when the installed Graphviz build lacks PDF output."""
+        dot_output_formats.return_value = frozenset({"png", "svg"})
+
+        with patch("app.services.export.subprocess.run") as mock_run:
+            with pytest.raises(RuntimeError, match="does not support PDF output"):
+                export_as_image(single_host_graph, "pdf", graph_id=1)
+        mock_run.assert_not_called()
+
 
 @pytest.mark.unit
 @pytest.mark.requires_graphviz
@@ -557,71 +761,156 @@ class TestSVGGeneration:
 class TestGraphFiltering:
     """Test graph filtering for exports."""
 
-    @pytest.mark.skip(reason="Filtering implemented in graphs.py router, not export service")
-    def test_apply_graph_filters_by_role(self, tmp_path: Path):
+    def test_apply_graph_filters_by_role(self, forwarding_chain_graph: dict):
         """Filter graph to show only specific roles."""
-        # NOTE: Graph filtering is implemented in graphs.py router's /query endpoint
-        # (lines 175-284), not in the export service
-        pass
+        original = copy.deepcopy(forwarding_chain_graph)
+
+        filtered = apply_graph_filters(forwarding_chain_graph, roles=["heavy_forwarder", "indexer"])
+
+        assert [h["id"] for h in filtered["hosts"]] == ["hf01", "idx01", "idx02"]
+        # Edges touching a removed host are dropped
+        assert [(e["src_host"], e["dst_host"]) for e in filtered["edges"]] == [
+            ("hf01", "idx01"),
+            ("hf01", "idx02"),
+        ]
+        assert filtered["meta"] == {"host_count": 3, "edge_count": 2}
+        # Input graph is left untouched
+        assert forwarding_chain_graph == original
 
-    @pytest.mark.skip(reason="Filtering implemented in graphs.py router, not export service")
-    def test_apply_graph_filters_by_index(self, tmp_path: Path):
+    def test_apply_graph_filters_by_index(self, forwarding_chain_graph: dict):
         """Filter graph to show only edges with specific index."""
-        # NOTE: Graph filtering is implemented in graphs.py router's /query endpoint
-        pass
+        filtered = apply_graph_filters(forwarding_chain_graph, index="security")
+
+        assert [(e["src_host"], e["dst_host"]) for e in filtered["edges"]] == [
+            ("uf01", "hf01"),
+            ("hf01", "idx02"),
+        ]
+        # Only hosts referenced by matching edges remain
+        assert [h["id"] for h in filtered["hosts"]] == ["uf01", "hf01", "idx02"]
 
-    @pytest.mark.skip(reason="Filtering implemented in graphs.py router, not export service")
-    def test_apply_graph_filters_by_host(self, tmp_path: Path):
+    def test_apply_graph_filters_by_host(self, forwarding_chain_graph: dict):
         """Filter graph to show only specific hosts."""
-        # NOTE: Graph filtering is implemented in graphs.py router's /query endpoint
-        pass
+        filtered = apply_graph_filters(forwarding_chain_graph, host="IDX")
+
+        assert [(e["src_host"], e["dst_host"]) for e in filtered["edges"]] == [
+            ("hf01", "idx01"),
+            ("hf01", "idx02"),
+        ]
+        assert [h["id"] for h in filtered["hosts"]] == ["hf01", "idx01", "idx02"]
 
-    @pytest.mark.skip(reason="Filtering implemented in graphs.py router, not export service")
-    def test_apply_graph_filters_combined(self, tmp_path: Path):
+    def test_apply_graph_filters_combined(self, forwarding_chain_graph: dict):
         """Apply multiple filters simultaneously."""
-        # NOTE: Graph filtering is implemented in graphs.py router's /query endpoint
-        pass
+        filtered = apply_graph_filters(
+            forwarding_chain_graph,
+            host="hf01",
+            index="main",
+            protocol="splunktcp",
+            roles=["heavy_forwarder", "indexer"],
+        )
+
+        assert [(e["src_host"], e["dst_host"]) for e in filtered["edges"]] == [("hf01", "idx01")]
+        assert [h["id"] for h in filtered["hosts"]] == ["hf01", "idx01"]
+        assert filtered["meta"] == {"host_count": 2, "edge_count": 1}
+
+        # No filters keeps the whole graph
+        unfiltered = apply_graph_filters(forwarding_chain_graph)
+        assert unfiltered["hosts"] == forwarding_chain_graph["hosts"]
+        assert unfiltered["edges"] == forwarding_chain_graph["edges"]
 
 
 @pytest.mark.unit
 class TestExportArchive:
     """Test multi-format export archive creation."""
 
-    @pytest.mark.skip(reason="Multi-format archive export not implemented")
-    def test_create_export_archive_all_formats(self, tmp_path: Path):
+    def test_create_export_archive_all_formats(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Create .zip archive with DOT, JSON, PNG, PDF."""
-        # NOTE: Export archive creation is not implemented in export.py
-        # Only single-format exports are supported
-        pass
-
-    @pytest.mark.skip(reason="Multi-format archive export not implemented")
-    def test_create_export_archive_selective(self, tmp_path: Path):
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run) as mock_run:
+            archive_path = create_export_archive(canonical_graph, graph_id=1)
+
+        dot_string = build_dot_from_canonical_graph(canonical_graph)
+        # Each image format is rendered from the same DOT piped over stdin
+        assert mock_run.call_count == 2
+        for call in mock_run.call_args_list:
+            assert call.kwargs["input"] == dot_string.encode()
+        assert archive_path.name == "graph_1.zip"
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.namelist() == [
+                "graph.dot",
+                "graph.json",
+                "graph.png",
+                "graph.pdf",
+                "metadata.json",
+            ]
+            assert zf.read("graph.dot").decode() == dot_string
+            assert orjson.loads(zf.read("graph.json")) == canonical_graph
+            assert zf.read("graph.png") == b"rendered png"
+            assert zf.read("graph.pdf") == b"rendered pdf"
+
+    def test_create_export_archive_png_stored(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
+        """Verify already-compressed images are stored and text entries deflated."""
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run):
+            archive_path = create_export_archive(canonical_graph, graph_id=1)
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.getinfo("graph.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("graph.pdf").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("graph.dot").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("graph.json").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_create_export_archive_no_temp_files(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
+        """Verify rendered images are streamed into the archive without temp files."""
+        with patch("app.services.export.subprocess.run", side_effect=fake_dot_run):
+            archive_path = create_export_archive(single_host_graph, graph_id=1)
+
+        assert [p.name for p in archive_path.parent.iterdir()] == ["graph_1.zip"]
+
+    def test_create_export_archive_render_failure(self, tmp_path: Path, temp_storage_root: Path):
+        """Verify a failed render leaves no partial archive behind."""
+        graph_json = {"hosts": [], "edges": [], "meta": {}}
+
+        with patch(
+            "app.services.export.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "dot", stderr=b"syntax error"),
+        ):
+            with pytest.raises(RuntimeError, match="syntax error"):
+                create_export_archive(graph_json, graph_id=1)
+
+        assert not list(temp_storage_root.rglob("*.zip"))
+
+    def test_create_export_archive_selective(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Create archive with only selected formats."""
-        # NOTE: Multi-format archives would need to be implemented separately
-        pass
+        with patch("app.services.export.subprocess.run") as mock_run:
+            archive_path = create_export_archive(
+                single_host_graph, graph_id=1, formats=["dot", "json"]
+            )
 
-    @pytest.mark.skip(reason="Multi-format archive export not implemented")
-    def test_create_export_archive_metadata(self, tmp_path: Path):
-        """Include metadata.json in export archive."""
-        # NOTE: Archive metadata would be part of archive creation feature
-        pass
+        # No image formats requested, so Graphviz is never invoked
+        mock_run.assert_not_called()
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.namelist() == ["graph.dot", "graph.json", "metadata.json"]
 
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            create_export_archive(single_host_graph, graph_id=1, formats=["svg"])
 
-@pytest.mark.unit
-class TestExportRouter:
-    """Test the main export_graph router function."""
-
-    def test_export_graph_dot_format(self, tmp_path: Path):
-        """Export graph in DOT format."""
+    def test_create_export_archive_filtered(self, tmp_path: Path, temp_storage_root: Path):
+        """Apply graph filters before generating archive contents."""
         graph_json = {
             "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-                {"id": "host2", "roles": ["indexer"], "labels": [], "apps": []},
+                {"id": "uf01", "roles": ["universal_forwarder"], "labels": [], "apps": []},
+                {"id": "idx01", "roles": ["indexer"], "labels": [], "apps": []},
             ],
             "edges": [
                 {
-                    "src_host": "host1",
-                    "dst_host": "host2",
+                    "src_host": "uf01",
+                    "dst_host": "idx01",
                     "protocol": "splunktcp",
                     "indexes": ["main"],
                     "tls": False,
@@ -631,76 +920,127 @@ class TestExportRouter:
             "meta": {},
         }
 
-        content, media_type = export_graph(graph_json, "dot", graph_id=1)
+        archive_path = create_export_archive(
+            graph_json, graph_id=1, formats=["dot", "json"], filters={"roles": {"indexer"}}
+        )
+
+        with zipfile.ZipFile(archive_path) as zf:
+            dot_content = zf.read("graph.dot").decode()
+            exported = orjson.loads(zf.read("graph.json"))
+            metadata = orjson.loads(zf.read("metadata.json"))
+        assert '"idx01"' in dot_content
+        assert "uf01" not in dot_content
+        assert [h["id"] for h in exported["hosts"]] == ["idx01"]
+        assert exported["edges"] == []
+        assert metadata["filters"] == {"roles": ["indexer"]}
+
+    def test_create_export_archive_renders_concurrently(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
+        """Verify PNG and PDF renders are in flight at the same time."""
+        # Each fake render blocks until the other has started; sequential
+        # rendering would time out and break the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def overlapping_dot_run(cmd, **kwargs):
+            barrier.wait()
+            return fake_dot_run(cmd, **kwargs)
+
+        with patch("app.services.export.subprocess.run", side_effect=overlapping_dot_run):
+            archive_path = create_export_archive(
+                single_host_graph, graph_id=1, formats=["png", "pdf"]
+            )
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.namelist() == ["graph.png", "graph.pdf", "metadata.json"]
+
+    def test_create_export_archive_reuses_dot(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
+        """Verify DOT is built once and shared by the DOT entry and rendered images."""
+        with (
+            patch("app.services.export.subprocess.run", side_effect=fake_dot_run),
+            patch(
+                "app.services.export.build_dot_from_canonical_graph",
+                wraps=build_dot_from_canonical_graph,
+            ) as spy,
+        ):
+            create_export_archive(single_host_graph, graph_id=1)
+
+        assert spy.call_count == 1
+
+    def test_create_export_archive_metadata(
+        self, canonical_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
+        """Include metadata.json in export archive."""
+        archive_path = create_export_archive(
+            canonical_graph,
+            graph_id=7,
+            formats=["dot", "json"],
+            filters={"roles": frozenset({"universal_forwarder", "indexer"})},
+        )
+
+        with zipfile.ZipFile(archive_path) as zf:
+            metadata = orjson.loads(zf.read("metadata.json"))
+
+        assert metadata["graph_id"] == 7
+        assert datetime.fromisoformat(metadata["created_at"]).tzinfo is not None
+        assert metadata["generator"] == GENERATOR
+        assert metadata["formats"] == ["dot", "json"]
+        assert metadata["filters"] == {"roles": ["indexer", "universal_forwarder"]}
+        assert metadata["host_count"] == 2
+        assert metadata["edge_count"] == 1
+
+
+@pytest.mark.unit
+class TestExportRouter:
+    """Test the main export_graph router function."""
+
+    def test_export_graph_dot_format(self, canonical_graph: dict, tmp_path: Path):
+        """Export graph in DOT format."""
+        content, media_type = export_graph(canonical_graph, "dot", graph_id=1)
 
         assert isinstance(content, str)
         assert media_type == "text/vnd.graphviz"
         assert "digraph G {" in content
 
-    def test_export_graph_json_format(self, tmp_path: Path):
+    def test_export_graph_json_format(self, single_host_graph: dict):
         """Export graph in JSON format."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
+        content, media_type = export_graph(single_host_graph, "json", graph_id=1)
 
-        content, media_type = export_graph(graph_json, "json", graph_id=1)
-
-        assert isinstance(content, str)
+        # Bytes go straight into the response body without a str -> bytes encode
+        assert isinstance(content, bytes)
         assert media_type == "application/json"
         # Verify valid JSON
-        parsed = json.loads(content)
+        parsed = orjson.loads(content)
         assert "hosts" in parsed
 
     @pytest.mark.requires_graphviz
-    def test_export_graph_png_format(self, tmp_path: Path, temp_storage_root: Path):
+    def test_export_graph_png_format(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Export graph in PNG format."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
-        content, media_type = export_graph(graph_json, "png", graph_id=1)
+        content, media_type = export_graph(single_host_graph, "png", graph_id=1)
 
         assert isinstance(content, Path)
         assert media_type == "image/png"
         assert content.exists()
 
     @pytest.mark.requires_graphviz
-    def test_export_graph_pdf_format(self, tmp_path: Path, temp_storage_root: Path):
+    def test_export_graph_pdf_format(
+        self, single_host_graph: dict, tmp_path: Path, temp_storage_root: Path
+    ):
         """Export graph in PDF format."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
-        content, media_type = export_graph(graph_json, "pdf", graph_id=1)
+        content, media_type = export_graph(single_host_graph, "pdf", graph_id=1)
 
         assert isinstance(content, Path)
         assert media_type == "application/pdf"
         assert content.exists()
 
-    def test_export_graph_invalid_format(self, tmp_path: Path):
+    def test_export_graph_invalid_format(self, single_host_graph: dict, tmp_path: Path):
         """Verify invalid format raises error."""
-        graph_json = {
-            "hosts": [
-                {"id": "host1", "roles": ["universal_forwarder"], "labels": [], "apps": []},
-            ],
-            "edges": [],
-            "meta": {},
-        }
-
         with pytest.raises(ValueError) as exc_info:
-            export_graph(graph_json, "invalid", graph_id=1)
+            export_graph(single_host_graph, "invalid", graph_id=1)
         assert "Unsupported export format" in str(exc_info.value)
 
     def test_validate_export_format_valid(self, tmp_path: Path):
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 
+import orjson
 import pytest
 
 from app.services.parser import (
@@ -871,7 +872,7 @@ class TestCanonicalGraphBuilding:
         assert json_str is not None
 
         # Should be deserializable
-        deserialized = json.loads(json_str)
+        deserialized = orjson.loads(json_str)
         assert deserialized["hosts"] == graph["hosts"]
         assert deserialized["edges"] == graph["edges"]
 
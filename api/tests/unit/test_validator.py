@@ -712,7 +712,6 @@ class TestCompleteValidation:
         project = Project(name="Test Project", labels=["test"])
         test_db.add(project)
         test_db.commit()
-        test_db.refresh(project)
 
         upload = Upload(
             project_id=project.id,
@@ -723,7 +722,6 @@ class TestCompleteValidation:
         )
         test_db.add(upload)
         test_db.commit()
-        test_db.refresh(upload)
 
         job = Job(
             upload_id=upload.id,
@@ -731,7 +729,6 @@ class TestCompleteValidation:
         )
         test_db.add(job)
         test_db.commit()
-        test_db.refresh(job)
 
         graph = Graph(
             project_id=project.id,
@@ -746,7 +743,6 @@ class TestCompleteValidation:
         )
         test_db.add(graph)
         test_db.commit()
-        test_db.refresh(graph)
 
         # Create finding dicts
         finding_dicts = [
@@ -799,7 +795,6 @@ class TestCompleteValidation:
         })
         sample_graph.json_blob = graph_json
         test_db.commit()
-        test_db.refresh(sample_graph)
 
         # Call validate_and_store_findings
         findings = validate_and_store_findings(sample_graph.id, test_db)